@@ -56,7 +56,7 @@ class AwardsUpdater:
                 print(f"  Warning: Variety fetch returned status {response.status_code}")
                 return predictions
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Look for film titles in various structures Variety might use
             # This is a best-effort extraction and may need adjustment
@@ -110,7 +110,7 @@ class AwardsUpdater:
                 print(f"  Warning: Gold Derby fetch returned status {response.status_code}")
                 return predictions
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Gold Derby usually has odds tables or lists
             # Look for film titles in table rows or list items
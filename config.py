@@ -2,6 +2,9 @@
 Configuration for NYC Movie Screening Notifier
 """
 import os
+import functools
+import re
+import pygtrie
 from datetime import datetime, timedelta
 
 # Email configuration
@@ -21,6 +24,28 @@ REDDIT_CLIENT_ID = os.environ.get('REDDIT_CLIENT_ID', '')  # Deprecated
 REDDIT_CLIENT_SECRET = os.environ.get('REDDIT_CLIENT_SECRET', '')  # Deprecated
 REDDIT_USER_AGENT = 'NYC Movie Screening Scraper v1.0'  # Kept for compatibility
 
+# Maximum number of sites fetched at the same time by the concurrent smoke tests
+FETCH_WORKERS = int(os.environ.get('FETCH_WORKERS', '4'))
+
+# Set FORCE_RESCRAPE=1 to ignore every cached page and fetch everything fresh
+FORCE_RESCRAPE = os.environ.get('FORCE_RESCRAPE', '') == '1'
+
+# Playwright render cache - rendered listing pages are reused for this many seconds
+# so repeated local runs skip browser rendering. Set to 0 to disable.
+JS_CACHE_DIR = 'data/js_cache'
+JS_CACHE_TTL_SECONDS = 0 if FORCE_RESCRAPE else int(os.environ.get('FEATUREFINDER_JS_CACHE_TTL', '900'))
+
+# Screenings parsed from each listing page, reused while the page is unchanged
+SCRAPED_MANIFEST_PATH = 'data/scraped_manifest.sqlite3'
+
+# Parse Screenslate and Time Out listings with selectolax (a C HTML parser) when it is
+# installed. Set FEATUREFINDER_SELECTOLAX=0 to use the BeautifulSoup path instead.
+USE_SELECTOLAX = os.environ.get('FEATUREFINDER_SELECTOLAX', '1') != '0'
+
+# Playwright browser profile shared by all renders, so its disk cache keeps site assets
+# between runs (e.g. 'data/browser_profile'). Empty = a fresh browser context per render.
+BROWSER_PROFILE_DIR = os.environ.get('FEATUREFINDER_BROWSER_PROFILE', '')
+
 # Date range for upcoming week
 def get_week_range():
     """Get the date range for the upcoming week"""
@@ -37,6 +62,7 @@ def get_week_range():
 THEATERS = {
     'Film at Lincoln Center': {
         'url': 'https://www.filmlinc.org/',
+        'aliases': ['Lincoln Center', 'Film Society of Lincoln Center', 'Walter Reade Theater'],
         'location': 'Manhattan',
         'priority': 1
     },
@@ -52,11 +78,13 @@ THEATERS = {
     },
     'Paris Theater': {
         'url': 'https://www.paristheatrenyc.com/',
+        'aliases': ['Paris Theatre'],
         'location': 'Manhattan',
         'priority': 1
     },
     'Angelika Film Center': {
         'url': 'https://www.angelikafilmcenter.com/nyc',
+        'aliases': ['Angelika'],
         'location': 'Manhattan',
         'priority': 1
     },
@@ -77,21 +105,44 @@ THEATERS = {
     },
     'The Roxy Cinema': {
         'url': 'https://www.roxycinemanewyork.com/',
+        'aliases': ['Roxy Cinema'],
         'location': 'Manhattan',
         'priority': 2
     },
     'Alamo Drafthouse Lower Manhattan': {
         'url': 'https://drafthouse.com/nyc',
+        'aliases': ['Alamo Drafthouse Manhattan'],
         'location': 'Manhattan',
         'priority': 1
     },
     'MoMA': {
         'url': 'https://www.moma.org/calendar/film',
+        'aliases': ['Museum of Modern Art', 'The Museum of Modern Art'],
         'location': 'Manhattan',
         'priority': 3
     }
 }
 
+
+def _theater_key(name: str) -> str:
+    """Normalize a theater name to its lowercase words, separated by single spaces"""
+    return ' '.join(re.findall(r'\w+', name.lower()))
+
+
+# Theater names and aliases -> URL, keyed by words so the longest matching name prefix wins
+_THEATER_TRIE = pygtrie.StringTrie(separator=' ')
+for _name, _info in THEATERS.items():
+    for _alias in [_name] + _info.get('aliases', []):
+        _THEATER_TRIE[_theater_key(_alias)] = _info['url']
+
+# Listings add a room or branch after a separator ('Lincoln Center - Walter Reade'),
+# so only the part before it has to name the theater
+_THEATER_NAME_SEPARATOR = re.compile(r'\s[-|]\s|[\u2013\u2014:,(]')
+
+# Words that may follow a theater's name without making it a different venue
+# ('Angelika Film Center & Café'); anything else, like 'MoMA PS1', is not a match
+_THEATER_SUFFIX_WORDS = {'nyc', 'new', 'york', 'manhattan', 'theater', 'theatre', 'cinema', 'cinemas', 'cafe', 'café'}
+
 # Keywords that indicate special screenings (comprehensive list)
 SPECIAL_KEYWORDS = [
     # Q&A and appearances
@@ -268,13 +319,24 @@ EXCLUDE_PATTERNS = [
     'regular screening'
 ]
 
+@functools.lru_cache(maxsize=256)
 def get_theater_url(theater_name: str) -> str:
     """
     Get the base URL for a theater by name.
+    Case, punctuation, anything after a separator like ' - ' and generic words such as
+    'NYC' or 'Café' after a known name or alias are ignored, so 'film at lincoln center '
+    and 'Lincoln Center - Walter Reade' both match but 'MoMA PS1' does not.
     Returns the theater's URL or empty string if not found.
+    Results are cached since scrapers look up the same few theaters for every screening.
     """
-    theater_config = THEATERS.get(theater_name, {})
-    return theater_config.get('url', '')
+    key = _theater_key(_THEATER_NAME_SEPARATOR.split(theater_name, 1)[0])
+    match = _THEATER_TRIE.longest_prefix(key)
+    if not match:
+        return ''
+    extra_words = key[len(match.key):].split()
+    if all(word in _THEATER_SUFFIX_WORDS or word.isdigit() for word in extra_words):
+        return match.value
+    return ''
 
 # =============================================================================
 # Dynamic Awards Data Loading
@@ -0,0 +1,77 @@
+"""
+Shared pytest fixtures
+
+The live scraper tests all fetch through the same HTTP client and render with the
+same Playwright browser for the whole test session, instead of each test (or each
+scraper call) setting up its own.
+"""
+import os
+import pytest
+
+# The concurrent smoke test (test_scrapers_smoke.py) covers these sites in a pytest run;
+# the per-site scripts stay runnable directly (python test_moma.py) for detailed output
+collect_ignore = ['test_lincoln_center.py', 'test_moma.py', 'test_paris_theater.py']
+# test_correct_format.py calls SerpAPI at import time - collecting it would spend an API
+# call per xdist worker. Run it directly instead.
+collect_ignore.append('test_correct_format.py')
+
+# Keep rendered pages for an hour in test runs, so re-running the live scraper tests
+# reads data/js_cache instead of rendering every site again. FORCE_RESCRAPE=1 bypasses it.
+os.environ.setdefault('FEATUREFINDER_JS_CACHE_TTL', '3600')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Workers for `-n auto`: one per CPU, capped by FETCH_WORKERS and by GB of RAM
+    (each worker may launch its own browser)"""
+    workers = min(os.cpu_count() or 1, int(os.environ.get('FETCH_WORKERS', '4')))
+    try:
+        ram_gb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 1024 ** 3
+        workers = min(workers, ram_gb)
+    except (AttributeError, ValueError, OSError):
+        pass
+    return max(workers, 1)
+
+
+# Scraper modules are imported inside the fixtures so collecting the offline tests doesn't
+# start Playwright. config reads SERPAPI_KEY once, when it is first imported - usually by
+# an earlier test module - so SerpAPI tests get the key through the serpapi_key fixture.
+
+
+@pytest.fixture(scope='session')
+def shared_http_client():
+    """The pooled HTTP/2 client every scraper's fetch_page uses"""
+    from scrapers.base import shared_http_client
+    return shared_http_client
+
+
+@pytest.fixture
+def serpapi_key(monkeypatch, shared_http_client):
+    """Patch SERPAPI_KEY (from the environment) into config - skips without a key or network"""
+    import httpx
+    import config
+    key = os.environ.get('SERPAPI_KEY', '')
+    if not key:
+        pytest.skip("SERPAPI_KEY not set")
+    try:
+        shared_http_client.head('https://serpapi.com/', timeout=5)
+    except httpx.HTTPError as e:
+        pytest.skip(f"serpapi.com not reachable: {e}")
+    monkeypatch.setattr(config, 'SERPAPI_KEY', key)
+    return key
+
+
+@pytest.fixture(scope='session')
+def playwright_browser():
+    """The browser every scraper renders with - closed when the session ends"""
+    from scrapers.browser_pool import shared_browser
+    yield shared_browser
+    shared_browser.close()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def fresh_scrape_manifest():
+    """Start every test session from an empty scrape manifest, so the live scraper
+    tests always run the parsers (rendered pages are still reused from data/js_cache)"""
+    from scraped_manifest import reset_manifest
+    reset_manifest()
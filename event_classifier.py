@@ -4,7 +4,8 @@ Event Classifier for detecting and tagging special screening types
 This module provides centralized logic for detecting what makes a screening special
 based on keywords in the title, description, and other text fields.
 """
-from typing import List, Set
+from typing import Dict, List, Set
+from keyword_matcher import KeywordMatcher
 import re
 
 
@@ -106,12 +107,12 @@ class EventClassifier:
         # Combine all text for analysis
         combined_text = f"{text} {title} {description}".lower()
 
-        tags: Set[str] = set()
-
-        # Check each category
-        for tag_name, keywords in cls.KEYWORDS.items():
-            if cls._has_keyword(combined_text, keywords):
-                tags.add(tag_name)
+        # One pass over the text finds every keyword; map them back to their categories
+        tags: Set[str] = {
+            tag_name
+            for keyword in _KEYWORD_MATCHER.find(combined_text)
+            for tag_name in _KEYWORD_TAGS[keyword]
+        }
 
         # Apply some logic to merge/prioritize tags
         tags = cls._refine_tags(tags, combined_text)
@@ -120,9 +121,17 @@ class EventClassifier:
         return sorted(list(tags))
 
     @classmethod
-    def _has_keyword(cls, text: str, keywords: List[str]) -> bool:
-        """Check if text contains any of the keywords"""
-        return any(keyword in text for keyword in keywords)
+    def classify_batch(cls, texts: List[str]) -> List[List[str]]:
+        """
+        Classify many screening texts at once
+
+        Args:
+            texts: Texts to analyze (e.g. one description per screening)
+
+        Returns:
+            One sorted tag list per text, in the same order
+        """
+        return [cls.classify(text) for text in texts]
 
     @classmethod
     def _refine_tags(cls, tags: Set[str], text: str) -> Set[str]:
@@ -200,6 +209,15 @@ class EventClassifier:
         return sorted(list(set(all_keywords)))
 
 
+# Categories for each keyword (a keyword may belong to several), and an automaton
+# over all of them - built once at import instead of scanning per category
+_KEYWORD_TAGS: Dict[str, Set[str]] = {}
+for _tag_name, _keywords in EventClassifier.KEYWORDS.items():
+    for _keyword in _keywords:
+        _KEYWORD_TAGS.setdefault(_keyword, set()).add(_tag_name)
+_KEYWORD_MATCHER = KeywordMatcher(_KEYWORD_TAGS)
+
+
 # Convenience function for backward compatibility
 def classify_screening(text: str, title: str = '', description: str = '') -> str:
     """
@@ -0,0 +1,38 @@
+"""
+Multi-keyword matching for screening text
+
+Scrapers check the same block of text against dozens of keywords. Doing this with
+one `in` check per keyword scans the text once per keyword; the Aho-Corasick
+automaton used here finds every keyword in a single pass over the text.
+"""
+from typing import Iterable, Set
+import ahocorasick
+
+
+class KeywordMatcher:
+    """Finds which keywords from a fixed list appear in a piece of text"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton once for a list of keywords
+
+        Args:
+            keywords: Keywords to look for. Matching is case-insensitive; the
+                      keyword is returned exactly as given here.
+        """
+        self.automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self.automaton.add_word(keyword.lower(), keyword)
+        self.automaton.make_automaton()
+
+    def find(self, text_lower: str) -> Set[str]:
+        """
+        Find all keywords that occur in the text
+
+        Args:
+            text_lower: Text to search, already lowercased
+
+        Returns:
+            Set of matched keywords (overlapping matches are all reported)
+        """
+        return {keyword for _, keyword in self.automaton.iter(text_lower)}
@@ -0,0 +1,95 @@
+"""
+Manifest of scraped listing pages
+
+Records a hash of every listing page a scraper parsed (combined with a hash of the
+parsing code) together with the screenings it produced. When the same page comes back
+unchanged on a later run, the scraper reuses those screenings instead of parsing the
+page again. Entries expire after a day, and FORCE_RESCRAPE=1 ignores the manifest.
+"""
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple, Union
+import functools
+import hashlib
+import os
+import sqlite3
+import time
+import orjson
+from config import FORCE_RESCRAPE, SCRAPED_MANIFEST_PATH
+
+# Parsed results also depend on the date and the awards data, so don't reuse them forever
+MANIFEST_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the manifest database, creating it if needed"""
+    os.makedirs(os.path.dirname(SCRAPED_MANIFEST_PATH), exist_ok=True)
+    conn = sqlite3.connect(SCRAPED_MANIFEST_PATH, timeout=10)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS pages ('
+        'url TEXT PRIMARY KEY, page_hash TEXT NOT NULL, scraped_at REAL NOT NULL, records BLOB NOT NULL)'
+    )
+    return conn
+
+
+def page_hash(html: Union[str, bytes]) -> str:
+    """Hash of a listing page's HTML, as fetched"""
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    return hashlib.blake2b(html, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def source_version(source_files: Tuple[str, ...]) -> str:
+    """Hash of some source files - changes whenever one of them is edited"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in source_files:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def lookup(url: str, key: str) -> Optional[List[Dict]]:
+    """
+    Get the screenings recorded for a listing page, if it hasn't changed
+
+    Args:
+        url: Listing page URL
+        key: Identifies the page content and parser, e.g. page_hash() + source_version()
+
+    Returns:
+        The recorded screening dicts (Screening.to_dict), or None if the page is new,
+        the key has changed, the entry is too old, or FORCE_RESCRAPE is set
+    """
+    if FORCE_RESCRAPE:
+        return None
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                'SELECT page_hash, scraped_at, records FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+    if row is None or row[0] != key or time.time() - row[1] > MANIFEST_MAX_AGE_SECONDS:
+        return None
+    return orjson.loads(row[2])
+
+
+def mark(url: str, key: str, records: List[Dict]) -> None:
+    """Record the screenings parsed from a listing page (best effort - failures are ignored)"""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO pages (url, page_hash, scraped_at, records) VALUES (?, ?, ?, ?)',
+                (url, key, time.time(), orjson.dumps(records))
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"  Warning: Could not update scrape manifest: {e}")
+
+
+def reset_manifest() -> None:
+    """Forget every recorded page, so the next run parses everything again"""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute('DELETE FROM pages')
+    except (sqlite3.Error, OSError) as e:
+        print(f"  Warning: Could not reset scrape manifest: {e}")
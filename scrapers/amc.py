@@ -56,7 +56,7 @@ class AMCScraper(BaseScraper):
 
     def _fetch_theater_showtimes(self, theater_name: str, theater_info: Dict[str, str]) -> List[Screening]:
         """Fetch showtimes from SerpAPI for a specific theater"""
-        import requests
+        import httpx
 
         # Build SerpAPI request using correct format
         # Format: https://serpapi.com/search.json?q=AMC+Theater+Name&location=City,+State,+Country
@@ -69,14 +69,12 @@ class AMCScraper(BaseScraper):
         }
 
         try:
-            response = requests.get('https://serpapi.com/search.json', params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            data = self.fetch_json('https://serpapi.com/search.json', params=params, timeout=15)
 
             # Parse the showtimes from the response
             return self._parse_serpapi_response(data, theater_name)
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"    API request failed: {e}")
             return []
         except Exception as e:
@@ -3,11 +3,59 @@ Base scraper class for movie screening sources
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import Callable, Iterator, List, Dict, Optional
+import httpx
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+from config import JS_CACHE_DIR, JS_CACHE_TTL_SECONDS, USE_SELECTOLAX
+from .browser_pool import shared_browser
+import scraped_manifest
+import atexit
+import gzip
+import hashlib
+import importlib.util
+import os
+import sys
+import tempfile
 import time
 
+# One HTTP client shared by every scraper. The aggregator runs all scrapers in
+# parallel threads, so keep-alive connections (and their DNS/TLS setup) are reused
+# across scrapers, and HTTP/2 multiplexes concurrent requests to the same host.
+shared_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=15,
+    follow_redirects=True,
+    # Better headers to avoid being blocked. httpx sets Accept-Encoding to what it can
+    # decode (gzip, deflate and br with brotli installed), and HTTP/2 forbids a Connection header.
+    headers={
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'DNT': '1',
+        'Upgrade-Insecure-Requests': '1'
+    }
+)
+atexit.register(shared_http_client.close)
+
+# Stop downloading a page past this size - listing content is near the top, and the
+# rest of a huge page is usually inline data and trackers
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional - scrapers fall back to BeautifulSoup
+    LexborHTMLParser = None
+
+# Scrapers with a selectolax parse path use it when this is True
+FAST_PARSE = USE_SELECTOLAX and LexborHTMLParser is not None
+
+
+# Modules besides each scraper's own that shape the screenings it parses - editing any of
+# them invalidates the screenings recorded in the scrape manifest
+_PARSER_DEPENDENCIES = ('config', 'event_classifier', 'keyword_matcher', 'scrapers.base')
+
 
 class Screening:
     """Data class for a movie screening"""
@@ -44,6 +92,13 @@ class Screening:
             'tickets_on_sale': self.tickets_on_sale
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Screening':
+        """Rebuild a Screening from to_dict() output"""
+        fields = dict(data)
+        fields['time_slot'] = fields.pop('time', '')
+        return cls(**fields)
+
     def __repr__(self):
         return f"Screening({self.title} at {self.theater} on {self.date})"
 
@@ -53,30 +108,69 @@ class BaseScraper(ABC):
 
     def __init__(self, name: str):
         self.name = name
-        self.session = requests.Session()
-        # Better headers to avoid being blocked
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+        # Shared across scrapers - don't close it or change its headers
+        self.session = shared_http_client
+        # Hash of the HTML behind the last page fetched, for the scrape manifest
+        self.last_page_hash = ''
 
     @abstractmethod
     def scrape(self) -> List[Screening]:
         """Scrape screenings from the source"""
         pass
 
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch a page and return BeautifulSoup object"""
+    def iter_screenings(self) -> Iterator[Screening]:
+        """Yield screenings one at a time (scrapers that can stream override this)"""
+        yield from self.scrape()
+
+    def screenings_from_listing(self, url: str,
+                                parse: Callable[[], Iterator[Screening]]) -> Iterator[Screening]:
+        """
+        Yield the screenings on the listing page just fetched from url
+
+        If the page's HTML and the parsing code are both unchanged since the last scrape,
+        the screenings recorded then are reused and parse() isn't called. Otherwise the
+        screenings parse() yields are recorded once all of them have been consumed.
+        """
+        if not self.last_page_hash:
+            yield from parse()
+            return
+
+        key = f"{self.last_page_hash}:{self._parser_version()}"
+        records = scraped_manifest.lookup(url, key)
+        if records is not None:
+            print(f"  Listing unchanged since last scrape, reusing {len(records)} screenings")
+            yield from (Screening.from_dict(record) for record in records)
+            return
+
+        parsed = []
+        for screening in parse():
+            parsed.append(screening)
+            yield screening
+        # Don't record an empty result - it more likely means the site layout changed
+        if parsed:
+            scraped_manifest.mark(url, key, [screening.to_dict() for screening in parsed])
+
+    def _parser_version(self) -> str:
+        """Hash of this scraper's module and the modules it parses with"""
+        files = [sys.modules[type(self).__module__].__file__]
+        files += [importlib.util.find_spec(module).origin for module in _PARSER_DEPENDENCIES]
+        return scraped_manifest.source_version(tuple(files))
+
+    def fetch_page(self, url: str, retries: int = 3, parse_only: Optional[SoupStrainer] = None,
+                   fast: bool = False) -> Optional[BeautifulSoup]:
+        """Fetch a page and return BeautifulSoup object (a selectolax tree if fast and FAST_PARSE)"""
         for attempt in range(retries):
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                body = bytearray()
+                with self.session.stream('GET', url, timeout=10) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(65536):
+                        body += chunk
+                        if len(body) >= _MAX_PAGE_BYTES:
+                            print(f"  Warning: {url} is over {_MAX_PAGE_BYTES // 1024} KB, parsing only the start")
+                            break
+                # Both parsers accept the raw bytes, so skip decoding to str here
+                return self._parse_fetched(bytes(body), parse_only, fast)
             except Exception as e:
                 if attempt == retries - 1:
                     print(f"Failed to fetch {url}: {e}")
@@ -84,7 +178,23 @@ class BaseScraper(ABC):
                 time.sleep(2 ** attempt)
         return None
 
-    def fetch_page_js(self, url: str, wait_selector: str = None, timeout: int = 30000) -> Optional[BeautifulSoup]:
+    def fetch_json(self, url: str, params: Optional[Dict] = None, timeout: int = 15):
+        """
+        Fetch a JSON API response and decode it
+
+        The body is decoded with orjson straight from bytes, which is several times
+        faster than response.json() on large listings.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+            orjson.JSONDecodeError: If the body isn't valid JSON
+        """
+        response = self.session.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def fetch_page_js(self, url: str, wait_selector: str = None, timeout: int = 30000,
+                      parse_only: Optional[SoupStrainer] = None, fast: bool = False) -> Optional[BeautifulSoup]:
         """
         Fetch a JavaScript-rendered page using Playwright
 
@@ -92,50 +202,152 @@ class BaseScraper(ABC):
             url: URL to fetch
             wait_selector: CSS selector to wait for before returning (e.g., 'article.tile')
             timeout: Maximum time to wait in milliseconds (default 30s)
+            parse_only: Optional SoupStrainer - only matching tags (and their
+                        contents) are built into the returned tree
+            fast: Return a selectolax tree instead of BeautifulSoup when FAST_PARSE is on
 
         Returns:
             BeautifulSoup object with rendered content or None if failed
         """
+        # Reuse a recent render of the same page instead of launching a browser
+        cache_path = self._js_cache_path(url, wait_selector)
+        cached_html = self._read_js_cache(cache_path)
+        if cached_html is not None:
+            print(f"  Using cached render of {url}")
+            return self._parse_fetched(cached_html, parse_only, fast)
+
         try:
-            from playwright.sync_api import sync_playwright
+            # Render in the browser shared by all scrapers (launched on first use)
+            content, selector_found = shared_browser.render(
+                url,
+                wait_selector=wait_selector,
+                timeout=timeout,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            )
+
+            # Only cache renders that got as far as the content we waited for
+            if selector_found or not wait_selector:
+                self._write_js_cache(cache_path, content)
+
+            return self._parse_fetched(content, parse_only, fast)
+
+        except ImportError:
+            print(f"  Playwright not installed. Run: pip install playwright && playwright install chromium")
+            return None
+        except Exception as e:
+            print(f"  Failed to fetch {url} with Playwright: {e}")
+            return None
 
-            with sync_playwright() as p:
-                # Launch browser in headless mode
-                browser = p.chromium.launch(headless=True)
+    def fetch_page_static_first(self, url: str, wait_selector: str, timeout: int = 30000,
+                                parse_only: Optional[SoupStrainer] = None,
+                                fast: bool = False) -> Optional[BeautifulSoup]:
+        """
+        Fetch a page over plain HTTP, only rendering it with Playwright if needed
 
-                # Create a new page with realistic viewport
-                page = browser.new_page(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
+        Server-rendered pages already contain their listings, so the browser is only
+        launched when the static HTML is missing the content we are looking for. A
+        cached render of the page is used before either fetch.
 
-                # Navigate to the page (use 'domcontentloaded' which is more reliable)
-                page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+        Args:
+            url: URL to fetch
+            wait_selector: CSS selector that must match for the static HTML to be used
+            timeout: Maximum Playwright wait in milliseconds (default 30s)
+            parse_only: Optional SoupStrainer passed on to the parser. It must keep
+                        the elements wait_selector matches.
+            fast: Return a selectolax tree instead of BeautifulSoup when FAST_PARSE is on
 
-                # Wait for specific content to load if selector provided
-                if wait_selector:
-                    try:
-                        page.wait_for_selector(wait_selector, timeout=timeout)
-                    except Exception as e:
-                        print(f"  Warning: Selector '{wait_selector}' not found, continuing anyway...")
+        Returns:
+            BeautifulSoup object, or None if both fetches failed
+        """
+        # A recent render is at least as complete as the static HTML and costs no request
+        cached_html = self._read_js_cache(self._js_cache_path(url, wait_selector))
+        if cached_html is not None:
+            print(f"  Using cached render of {url}")
+            return self._parse_fetched(cached_html, parse_only, fast)
+
+        static_soup = self.fetch_page(url, retries=1, parse_only=parse_only, fast=fast)
+        if static_soup is not None and self._select_one(static_soup, wait_selector):
+            print(f"  Found '{wait_selector}' in static HTML, skipping Playwright")
+            return static_soup
+
+        print("  Using Playwright to render JavaScript content...")
+        soup = self.fetch_page_js(url, wait_selector=wait_selector, timeout=timeout,
+                                  parse_only=parse_only, fast=fast)
+        if soup is None and static_soup is not None:
+            print("  Playwright failed, using the static HTML...")
+            return static_soup
+        return soup
+
+    def _parse_fetched(self, html, parse_only: Optional[SoupStrainer] = None, fast: bool = False):
+        """Parse a fetched page, remembering the hash of its HTML"""
+        self.last_page_hash = scraped_manifest.page_hash(html)
+        return self._parse_html(html, parse_only, fast)
 
-                # Give JavaScript a moment to finish rendering
-                page.wait_for_timeout(2000)
+    @staticmethod
+    def _parse_html(html, parse_only: Optional[SoupStrainer] = None, fast: bool = False):
+        """Build the document tree - selectolax if fast and FAST_PARSE, otherwise BeautifulSoup"""
+        if fast and FAST_PARSE:
+            tree = LexborHTMLParser(html)
+            # BeautifulSoup's get_text() leaves out script and style contents; do the same
+            tree.strip_tags(['script', 'style'])
+            return tree
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
 
-                # Get the fully rendered HTML
-                content = page.content()
+    @staticmethod
+    def _select_one(tree, selector: str):
+        """First element matching a CSS selector in either a BeautifulSoup or selectolax tree"""
+        if isinstance(tree, BeautifulSoup):
+            return tree.select_one(selector)
+        return tree.css_first(selector)
 
-                browser.close()
+    @staticmethod
+    def css_first_within(node, selector: str):
+        """
+        First descendant of a selectolax node matching a CSS selector
 
-                return BeautifulSoup(content, 'html.parser')
+        selectolax also tests the node itself, unlike BeautifulSoup's find() and
+        select_one(), so skip it to get the same element the BeautifulSoup path would.
+        """
+        match = node.css_first(selector)
+        if match is None or match != node:
+            return match
+        return next((m for m in node.css(selector) if m != node), None)
 
-        except ImportError:
-            print(f"  Playwright not installed. Run: pip install playwright && playwright install chromium")
+    @staticmethod
+    def _js_cache_path(url: str, wait_selector: str = None) -> str:
+        """Cache file for a rendered page, keyed by URL and wait selector"""
+        key = hashlib.blake2b(f"{url}\n{wait_selector or ''}".encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(JS_CACHE_DIR, f"{key}.html.gz")
+
+    @staticmethod
+    def _read_js_cache(cache_path: str) -> Optional[str]:
+        """Return cached rendered HTML if it is younger than the cache TTL, else None"""
+        if JS_CACHE_TTL_SECONDS <= 0:
             return None
-        except Exception as e:
-            print(f"  Failed to fetch {url} with Playwright: {e}")
+        try:
+            if time.time() - os.path.getmtime(cache_path) > JS_CACHE_TTL_SECONDS:
+                return None
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError):
             return None
 
+    @staticmethod
+    def _write_js_cache(cache_path: str, html: str) -> None:
+        """Store rendered HTML in the cache (best effort - failures are ignored)"""
+        if JS_CACHE_TTL_SECONDS <= 0:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write to a temp file and rename so parallel scrapers never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(html.encode('utf-8'))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  Warning: Could not cache rendered page: {e}")
+
     def is_special_screening(self, text: str) -> bool:
         """Check if text indicates a special screening"""
         text_lower = text.lower()
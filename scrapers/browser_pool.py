@@ -0,0 +1,228 @@
+"""
+Shared headless Chromium for scrapers that need JavaScript rendering
+
+Launching Chromium takes around a second, and every render used to launch its own
+browser. The browser is now started once on first use, and each render gets a fresh
+context (cookies, storage) and page inside it.
+
+Playwright's sync API only works from the thread that started it, but the aggregator
+runs scrapers in parallel threads. So the browser is driven by the async API from one
+background thread, and renders from different scrapers still run concurrently as
+separate pages in the same browser.
+
+With FEATUREFINDER_BROWSER_PROFILE set, the browser instead runs one persistent context
+from that profile directory, shared by every render, so its disk cache keeps site
+JavaScript bundles between runs.
+"""
+import asyncio
+import atexit
+import threading
+from typing import Optional, Tuple
+from config import BROWSER_PROFILE_DIR
+
+# Scrapers only read the rendered DOM, so don't download anything that just paints
+# pixels or tracks visitors
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+_ANALYTICS_DOMAINS = (
+    'googletagmanager.com', 'google-analytics.com', 'doubleclick.net', 'hotjar.com',
+    'segment.io', 'facebook.net', 'scorecardresearch.com'
+)
+
+# Playwright turns off the HTTP cache for contexts with request routing, so the
+# persistent profile blocks with Chromium flags instead: no images, and analytics
+# hosts fail to resolve. Stylesheets and fonts are downloaded once, then cached.
+_PROFILE_ARGS = [
+    '--disk-cache-size=268435456',
+    '--blink-settings=imagesEnabled=false',
+    '--host-resolver-rules=' + ', '.join(
+        rule for domain in _ANALYTICS_DOMAINS
+        for rule in (f'MAP {domain} ~NOTFOUND', f'MAP *.{domain} ~NOTFOUND')
+    ),
+]
+
+
+class BrowserPool:
+    """Lazily started Chromium shared by every scraper thread"""
+
+    def __init__(self, profile_dir: str = ''):
+        """
+        Args:
+            profile_dir: Browser profile directory to share one persistent context
+                         from, or '' for a fresh context per render
+        """
+        self.profile_dir = profile_dir
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._browser = None
+        self._shared_context = None
+
+    def render(self, url: str, wait_selector: str = None, timeout: int = 30000,
+               **context_options) -> Tuple[str, bool]:
+        """
+        Load a page in a new browser context and return its rendered HTML
+
+        Args:
+            url: URL to load
+            wait_selector: CSS selector to wait for before reading the page
+            timeout: Maximum time to wait in milliseconds
+            **context_options: Passed to browser.new_context (viewport, user_agent, ...)
+
+        Returns:
+            (html, selector_found) - selector_found is False if wait_selector never appeared
+        """
+        return self._run(self._render(url, wait_selector, timeout, context_options))
+
+    def fetch(self, url: str, timeout: int = 30000, **context_options) -> Tuple[Optional[int], bytes]:
+        """
+        Load a URL in a new browser context and return the raw response
+
+        Only waits for the response to start ('commit'), so nothing is rendered.
+
+        Returns:
+            (status, body) - status is None if there was no response
+        """
+        return self._run(self._fetch(url, timeout, context_options))
+
+    def close(self) -> None:
+        """Close the browser and stop its thread (safe to call when never started)"""
+        with self._lock:
+            if self._loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=10)
+            except Exception:
+                pass
+            self._stop_loop()
+
+    def _run(self, coroutine):
+        """Run a coroutine on the browser thread, starting the browser first if needed"""
+        try:
+            loop = self._ensure_started()
+        except BaseException:
+            coroutine.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever,
+                                            name='playwright-browser', daemon=True)
+            self._thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), self._loop).result()
+            except BaseException:
+                # e.g. Playwright or Chromium not installed - retry on the next call
+                self._stop_loop()
+                raise
+            return self._loop
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = self._thread = None
+
+    async def _launch(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            if self.profile_dir:
+                try:
+                    self._shared_context = await self._playwright.chromium.launch_persistent_context(
+                        self.profile_dir, headless=True, args=_PROFILE_ARGS
+                    )
+                    return
+                except Exception as e:
+                    # e.g. the profile is locked by another run
+                    print(f"  Warning: Could not open browser profile {self.profile_dir}: {e}")
+            self._browser = await self._playwright.chromium.launch(headless=True)
+        except BaseException:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+
+    async def _shutdown(self) -> None:
+        try:
+            if self._shared_context is not None:
+                await self._shared_context.close()
+            else:
+                await self._browser.close()
+        finally:
+            await self._playwright.stop()
+            self._browser = self._shared_context = self._playwright = None
+
+    async def _open_page(self, context_options):
+        """Open a page for one render; returns (page, context to close or None)"""
+        if self._shared_context is None:
+            context = await self._browser.new_context(**context_options)
+            await context.route('**/*', _block_unneeded_requests)
+            return await context.new_page(), context
+
+        # Shared persistent context - apply the options to the page instead
+        page = await self._shared_context.new_page()
+        if 'viewport' in context_options:
+            await page.set_viewport_size(context_options['viewport'])
+        if 'user_agent' in context_options:
+            await page.set_extra_http_headers({'User-Agent': context_options['user_agent']})
+        return page, None
+
+    @staticmethod
+    async def _close_page(page, context) -> None:
+        if context is not None:
+            await context.close()
+        else:
+            await page.close()
+
+    async def _render(self, url, wait_selector, timeout, context_options) -> Tuple[str, bool]:
+        page, context = await self._open_page(context_options)
+        try:
+            # Navigate to the page (use 'domcontentloaded' which is more reliable)
+            await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+
+            # Wait for specific content to load if selector provided
+            selector_found = False
+            if wait_selector:
+                try:
+                    await page.wait_for_selector(wait_selector, timeout=timeout)
+                    selector_found = True
+                except Exception:
+                    print(f"  Warning: Selector '{wait_selector}' not found, continuing anyway...")
+
+            # Without a confirmed selector, give JavaScript a moment to finish rendering
+            if not selector_found:
+                await page.wait_for_timeout(2000)
+
+            return await page.content(), selector_found
+        finally:
+            await self._close_page(page, context)
+
+    async def _fetch(self, url, timeout, context_options) -> Tuple[Optional[int], bytes]:
+        page, context = await self._open_page(context_options)
+        try:
+            response = await page.goto(url, wait_until='commit', timeout=timeout)
+            if response is None:
+                return None, b''
+            return response.status, await response.body()
+        finally:
+            await self._close_page(page, context)
+
+
+async def _block_unneeded_requests(route) -> None:
+    """Abort images, fonts, media, stylesheets and analytics; let everything else through"""
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(domain in request.url for domain in _ANALYTICS_DOMAINS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# The one browser every scraper renders with
+shared_browser = BrowserPool(BROWSER_PROFILE_DIR)
+atexit.register(shared_browser.close)
@@ -1,7 +1,7 @@
 """
 Scraper for Film at Lincoln Center
 """
-from typing import List
+from typing import Iterator, List
 from .base import BaseScraper, Screening
 from config import get_theater_url
 import re
@@ -16,7 +16,10 @@ class FilmAtLincolnCenterScraper(BaseScraper):
 
     def scrape(self) -> List[Screening]:
         """Scrape Film at Lincoln Center schedule"""
-        screenings = []
+        return list(self.iter_screenings())
+
+    def iter_screenings(self) -> Iterator[Screening]:
+        """Yield Film at Lincoln Center screenings as they are parsed"""
 
         try:
             # Use the now-playing page which shows all current screenings
@@ -36,50 +39,53 @@ class FilmAtLincolnCenterScraper(BaseScraper):
                 soup = self.fetch_page(url)
 
             if not soup:
-                return screenings
+                return
 
-            # Find film listings - look for common patterns in React-based cinema websites
-            # Try multiple strategies to find film content
+            # Reuse last run's screenings if neither the page nor the parser changed
+            yield from self.screenings_from_listing(url, lambda: self._parse_listing(soup))
 
-            # Strategy 1: Look for article elements (common in modern React sites)
-            articles = soup.find_all('article')
+        except Exception as e:
+            print(f"Error scraping Film at Lincoln Center: {e}")
 
-            # Strategy 2: Look for divs/sections with film-related classes
-            film_divs = soup.find_all(
-                ['div', 'section', 'li'],
-                class_=re.compile(r'film|movie|card|screening|event|showtime|series|show|program', re.I)
-            )
+    def _parse_listing(self, soup) -> Iterator[Screening]:
+        """Yield the screenings found on a Film at Lincoln Center listing page"""
+        # Find film listings - look for common patterns in React-based cinema websites
+        # Try multiple strategies to find film content
 
-            # Strategy 3: If we didn't find much, look for containers with multiple links (often film grids)
-            if len(articles) + len(film_divs) < 5:
-                print("  Found few elements, trying broader search...")
-                # Look for any div that contains multiple headings or links
-                all_containers = soup.find_all(['div', 'section', 'main'])
-                potential_containers = [
-                    c for c in all_containers
-                    if len(c.find_all(['h2', 'h3', 'h4'], limit=3)) >= 2
-                ]
-                film_divs.extend(potential_containers[:20])
-
-            # Combine and deduplicate
-            film_elements = list({id(elem): elem for elem in (articles + film_divs)}.values())
-
-            print(f"  Found {len(articles)} articles, {len(film_divs)} film-related divs")
-            print(f"  Total: {len(film_elements)} potential film elements")
-
-            for element in film_elements[:50]:
-                try:
-                    screening = self._parse_film(element)
-                    if screening:
-                        screenings.append(screening)
-                except Exception as e:
-                    print(f"  Error parsing Film at Lincoln Center screening: {e}")
-                    continue
+        # Strategy 1: Look for article elements (common in modern React sites)
+        articles = soup.find_all('article')
 
-        except Exception as e:
-            print(f"Error scraping Film at Lincoln Center: {e}")
+        # Strategy 2: Look for divs/sections with film-related classes
+        film_divs = soup.find_all(
+            ['div', 'section', 'li'],
+            class_=re.compile(r'film|movie|card|screening|event|showtime|series|show|program', re.I)
+        )
 
-        return screenings
+        # Strategy 3: If we didn't find much, look for containers with multiple links (often film grids)
+        if len(articles) + len(film_divs) < 5:
+            print("  Found few elements, trying broader search...")
+            # Look for any div that contains multiple headings or links
+            all_containers = soup.find_all(['div', 'section', 'main'])
+            potential_containers = [
+                c for c in all_containers
+                if len(c.find_all(['h2', 'h3', 'h4'], limit=3)) >= 2
+            ]
+            film_divs.extend(potential_containers[:20])
+
+        # Combine and deduplicate
+        film_elements = list({id(elem): elem for elem in (articles + film_divs)}.values())
+
+        print(f"  Found {len(articles)} articles, {len(film_divs)} film-related divs")
+        print(f"  Total: {len(film_elements)} potential film elements")
+
+        for element in film_elements[:50]:
+            try:
+                screening = self._parse_film(element)
+            except Exception as e:
+                print(f"  Error parsing Film at Lincoln Center screening: {e}")
+                continue
+            if screening:
+                yield screening
 
     def _parse_film(self, element) -> Screening:
         """Parse a film element"""
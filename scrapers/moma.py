@@ -1,7 +1,7 @@
 """
 Scraper for MoMA (Museum of Modern Art) Film Calendar
 """
-from typing import List
+from typing import Iterator, List
 from .base import BaseScraper, Screening
 from config import get_theater_url
 import re
@@ -16,7 +16,10 @@ class MoMAScraper(BaseScraper):
 
     def scrape(self) -> List[Screening]:
         """Scrape MoMA film calendar"""
-        screenings = []
+        return list(self.iter_screenings())
+
+    def iter_screenings(self) -> Iterator[Screening]:
+        """Yield MoMA screenings as they are parsed"""
 
         try:
             # MoMA's film calendar page
@@ -36,57 +39,60 @@ class MoMAScraper(BaseScraper):
                 soup = self.fetch_page(url)
 
             if not soup:
-                return screenings
+                return
 
-            # Find film/event listings - try multiple strategies
+            # Reuse last run's screenings if neither the page nor the parser changed
+            yield from self.screenings_from_listing(url, lambda: self._parse_listing(soup))
 
-            # Strategy 1: Look for article elements
-            articles = soup.find_all('article')
+        except Exception as e:
+            print(f"Error scraping MoMA: {e}")
 
-            # Strategy 2: Look for divs/sections with event/film-related classes
-            event_elements = soup.find_all(
-                ['div', 'section', 'li', 'a'],
-                class_=re.compile(r'event|film|movie|screening|calendar|card|item|entry|show', re.I)
-            )
+    def _parse_listing(self, soup) -> Iterator[Screening]:
+        """Yield the screenings found on a MoMA listing page"""
+        # Find film/event listings - try multiple strategies
 
-            # Strategy 3: Look for elements with data attributes (common in React apps)
-            data_elements = soup.find_all(
-                ['div', 'section', 'article'],
-                attrs={'data-event': True}
-            ) or soup.find_all(
-                ['div', 'section', 'article'],
-                attrs={'data-title': True}
-            )
+        # Strategy 1: Look for article elements
+        articles = soup.find_all('article')
 
-            # Strategy 4: Look for time elements (usually associated with events)
-            time_containers = []
-            time_elements = soup.find_all('time')
-            for time_elem in time_elements:
-                # Get the parent container
-                parent = time_elem.find_parent(['article', 'div', 'section', 'li'])
-                if parent and parent not in time_containers:
-                    time_containers.append(parent)
-
-            # Combine and deduplicate
-            all_elements = articles + event_elements + data_elements + time_containers
-            film_elements = list({id(elem): elem for elem in all_elements}.values())
-
-            print(f"  Found {len(articles)} articles, {len(event_elements)} event elements, {len(data_elements)} data elements, {len(time_containers)} time containers")
-            print(f"  Total: {len(film_elements)} potential film elements")
-
-            for element in film_elements[:100]:  # Limit to first 100 to avoid too much processing
-                try:
-                    screening = self._parse_event(element)
-                    if screening:
-                        screenings.append(screening)
-                except Exception as e:
-                    # Silently skip parsing errors for cleaner output
-                    continue
+        # Strategy 2: Look for divs/sections with event/film-related classes
+        event_elements = soup.find_all(
+            ['div', 'section', 'li', 'a'],
+            class_=re.compile(r'event|film|movie|screening|calendar|card|item|entry|show', re.I)
+        )
 
-        except Exception as e:
-            print(f"Error scraping MoMA: {e}")
+        # Strategy 3: Look for elements with data attributes (common in React apps)
+        data_elements = soup.find_all(
+            ['div', 'section', 'article'],
+            attrs={'data-event': True}
+        ) or soup.find_all(
+            ['div', 'section', 'article'],
+            attrs={'data-title': True}
+        )
 
-        return screenings
+        # Strategy 4: Look for time elements (usually associated with events)
+        time_containers = []
+        time_elements = soup.find_all('time')
+        for time_elem in time_elements:
+            # Get the parent container
+            parent = time_elem.find_parent(['article', 'div', 'section', 'li'])
+            if parent and parent not in time_containers:
+                time_containers.append(parent)
+
+        # Combine and deduplicate
+        all_elements = articles + event_elements + data_elements + time_containers
+        film_elements = list({id(elem): elem for elem in all_elements}.values())
+
+        print(f"  Found {len(articles)} articles, {len(event_elements)} event elements, {len(data_elements)} data elements, {len(time_containers)} time containers")
+        print(f"  Total: {len(film_elements)} potential film elements")
+
+        for element in film_elements[:100]:  # Limit to first 100 to avoid too much processing
+            try:
+                screening = self._parse_event(element)
+            except Exception as e:
+                # Silently skip parsing errors for cleaner output
+                continue
+            if screening:
+                yield screening
 
     def _parse_event(self, element) -> Screening:
         """Parse an event element"""
@@ -1,7 +1,7 @@
 """
 Scraper for Paris Theater
 """
-from typing import List
+from typing import Iterator, List
 from .base import BaseScraper, Screening
 from config import get_theater_url
 import re
@@ -16,7 +16,10 @@ class ParisTheaterScraper(BaseScraper):
 
     def scrape(self) -> List[Screening]:
         """Scrape Paris Theater schedule"""
-        screenings = []
+        return list(self.iter_screenings())
+
+    def iter_screenings(self) -> Iterator[Screening]:
+        """Yield Paris Theater screenings as they are parsed"""
 
         try:
             # Try main page first
@@ -31,25 +34,28 @@ class ParisTheaterScraper(BaseScraper):
                 soup = self.fetch_page(url)
 
             if not soup:
-                return screenings
-
-            # Find film listings - try multiple common patterns
-            film_elements = soup.find_all(['div', 'article', 'li', 'section'],
-                                         class_=re.compile(r'film|movie|screening|event|card|item|show', re.I))
+                return
 
-            for element in film_elements[:30]:
-                try:
-                    screening = self._parse_film(element)
-                    if screening:
-                        screenings.append(screening)
-                except Exception as e:
-                    print(f"Error parsing Paris Theater screening: {e}")
-                    continue
+            # Reuse last run's screenings if neither the page nor the parser changed
+            yield from self.screenings_from_listing(url, lambda: self._parse_listing(soup))
 
         except Exception as e:
             print(f"Error scraping Paris Theater: {e}")
 
-        return screenings
+    def _parse_listing(self, soup) -> Iterator[Screening]:
+        """Yield the screenings found on a Paris Theater listing page"""
+        # Find film listings - try multiple common patterns
+        film_elements = soup.find_all(['div', 'article', 'li', 'section'],
+                                     class_=re.compile(r'film|movie|screening|event|card|item|show', re.I))
+
+        for element in film_elements[:30]:
+            try:
+                screening = self._parse_film(element)
+            except Exception as e:
+                print(f"Error parsing Paris Theater screening: {e}")
+                continue
+            if screening:
+                yield screening
 
     def _parse_film(self, element) -> Screening:
         """Parse a film element"""
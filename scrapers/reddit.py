@@ -1,14 +1,40 @@
 """
 Scraper for r/NYCmovies subreddit using web scraping
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from .base import BaseScraper, Screening
+from .browser_pool import shared_browser
 import requests
 import re
-import time
-import json
+import orjson
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+from keyword_matcher import KeywordMatcher
+
+# Theaters mentioned in posts, in the order they should win when several appear
+THEATERS = [
+    'AMC Lincoln Square', 'AMC 84th', 'Paris Theater', 'Angelika',
+    'Film Forum', 'IFC Center', 'Metrograph', 'Alamo Drafthouse',
+    'Anthology', 'BAM', 'Quad', 'Nitehawk'
+]
+_THEATER_MATCHER = KeywordMatcher(THEATERS)
+
+# All date formats in one pattern; _DATE_FORMATS lists the groups in preference order
+_DATE_RE = re.compile(
+    r'(?P<numeric>\d{1,2}/\d{1,2})'  # MM/DD
+    r'|(?P<weekday>monday|tuesday|wednesday|thursday|friday|saturday|sunday)'
+    # The lookahead stops a month match from swallowing the start of an MM/DD date
+    r'|(?P<month>(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{1,2}(?!\d*/\d))',
+    re.I
+)
+_DATE_FORMATS = ('numeric', 'weekday', 'month')
+
+_NOTE_MATCHER = KeywordMatcher([
+    'q&a', 'q & a', 'director', 'appearance', 'present', 'imax', '70mm',
+    'premiere', 'advance screening', 'early screening', 'free', 'ticket'
+])
 
 
 class RedditScraper(BaseScraper):
@@ -31,83 +57,67 @@ class RedditScraper(BaseScraper):
 
     def scrape(self) -> List[Screening]:
         """Scrape recent posts from r/NYCmovies using web scraping"""
-        screenings = []
+        # Posts are deduplicated by URL as they stream in from each listing.
+        # The first listing to yield a URL wins (so pinned hot posts keep their priority).
+        unique_by_url = {}
 
         try:
-            # 1. Get the hot posts (includes pinned weekly summary)
-            print("Fetching hot posts (includes pinned weekly summaries)...")
-            hot_screenings = self._scrape_hot_posts()
-            screenings.extend(hot_screenings)
-            time.sleep(1)  # Brief delay between requests
-
-            # 2. Get posts with "Screening Info" flair
-            print("Fetching posts with 'Screening Info' flair...")
-            flair_screenings = self._scrape_by_flair('Screening Info')
-            screenings.extend(flair_screenings)
-            time.sleep(1)  # Brief delay between requests
-
-            # 3. Get recent new posts
-            print("Fetching recent new posts...")
-            new_screenings = self._scrape_new_posts()
-            screenings.extend(new_screenings)
-
-            # Remove duplicates based on URL
-            seen_urls = set()
-            unique_screenings = []
-            for screening in screenings:
-                if screening.url not in seen_urls:
-                    seen_urls.add(screening.url)
-                    unique_screenings.append(screening)
+            flair_name = 'Screening Info'
+            listing_urls = [
+                # 1. Hot posts (includes pinned weekly summary)
+                f"{self.base_url}/hot",
+                # 2. Posts with "Screening Info" flair
+                self._flair_search_url(flair_name),
+                # 3. Recent new posts
+                f"{self.base_url}/new",
+            ]
+
+            # Fetch all three listings at once so their page loads overlap.
+            # The worker threads share one browser (see browser_pool).
+            print(f"Fetching hot, '{flair_name}' flair and new posts concurrently...")
+            with ThreadPoolExecutor(max_workers=len(listing_urls)) as executor:
+                hot_data, flair_data, new_data = executor.map(self._fetch_json, listing_urls)
+
+            listings = itertools.chain(
+                self._scrape_hot_posts(hot_data),
+                self._scrape_by_flair(flair_data, flair_name),
+                self._scrape_new_posts(new_data),
+            )
+
+            for screening in listings:
+                unique_by_url.setdefault(screening.url, screening)
 
+            unique_screenings = list(unique_by_url.values())
             print(f"Found {len(unique_screenings)} unique screening posts from Reddit")
             return unique_screenings
 
         except Exception as e:
             print(f"Error scraping Reddit: {e}")
-            return screenings
+            return list(unique_by_url.values())
 
     def _fetch_json(self, url: str) -> Dict[str, Any]:
         """Fetch JSON data from a Reddit URL using Playwright to bypass blocking"""
         json_url = url if url.endswith('.json') else f"{url}.json"
 
         try:
-            with sync_playwright() as p:
-                # Launch browser in headless mode
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-                )
-                page = context.new_page()
-
-                # Navigate to the JSON endpoint
-                try:
-                    response = page.goto(json_url, wait_until='networkidle', timeout=30000)
-
-                    if response.status == 403:
-                        print(f"Access forbidden (403). Reddit may be blocking access.")
-                        browser.close()
-                        return {'data': {'children': []}}
-
-                    # Get the page content
-                    content = page.content()
-
-                    # Extract JSON from the page
-                    # Reddit serves JSON in a <pre> tag when accessed via browser
-                    if '<pre>' in content:
-                        # Extract JSON from <pre> tag
-                        start = content.find('<pre>') + 5
-                        end = content.find('</pre>')
-                        json_text = content[start:end]
-                    else:
-                        json_text = content
-
-                    browser.close()
-                    return json.loads(json_text)
-
-                except PlaywrightTimeout:
-                    print(f"Timeout loading {json_url}")
-                    browser.close()
-                    return {'data': {'children': []}}
+            # Use the browser shared by all scrapers. Only the response body is needed,
+            # so fetch() doesn't wait for the browser to render it.
+            status, body = shared_browser.fetch(
+                json_url,
+                timeout=30000,
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+            )
+
+            if status == 403:
+                print(f"Access forbidden (403). Reddit may be blocking access.")
+                return {'data': {'children': []}}
+
+            # Parse the raw JSON bytes rather than the <pre> the browser wraps them in
+            return orjson.loads(body)
+
+        except PlaywrightTimeout:
+            print(f"Timeout loading {json_url}")
+            return {'data': {'children': []}}
 
         except Exception as e:
             print(f"Error fetching JSON with Playwright: {e}")
@@ -115,17 +125,21 @@ class RedditScraper(BaseScraper):
             try:
                 response = requests.get(json_url, headers=self.headers, timeout=15)
                 if response.status_code == 200:
-                    return response.json()
+                    # orjson decodes the raw UTF-8 bytes directly
+                    return orjson.loads(response.content)
             except:
                 pass
 
             return {'data': {'children': []}}
 
-    def _scrape_hot_posts(self) -> List[Screening]:
-        """Scrape hot posts (includes pinned weekly summary)"""
-        screenings = []
+    def _flair_search_url(self, flair_name: str) -> str:
+        """Build the subreddit search URL for posts with the given flair"""
+        search_url = f"{self.base_url}/search"
+        return f"{search_url}?q=flair%3A%22{flair_name.replace(' ', '%20')}%22&restrict_sr=on&sort=new&limit=25"
+
+    def _scrape_hot_posts(self, data: Dict[str, Any]) -> Iterator[Screening]:
+        """Yield screenings from the hot posts listing (includes pinned weekly summary)"""
         try:
-            data = self._fetch_json(f"{self.base_url}/hot")
             posts = data['data']['children']
 
             for post_data in posts[:20]:  # Check first 20 hot posts
@@ -139,48 +153,28 @@ class RedditScraper(BaseScraper):
 
                 screening = self._parse_post(post, is_pinned=is_pinned)
                 if screening:
-                    screenings.append(screening)
+                    yield screening
 
         except Exception as e:
             print(f"Error scraping hot posts: {e}")
 
-        return screenings
-
-    def _scrape_by_flair(self, flair_name: str) -> List[Screening]:
-        """Scrape posts filtered by flair"""
-        screenings = []
+    def _scrape_by_flair(self, data: Dict[str, Any], flair_name: str) -> Iterator[Screening]:
+        """Yield screenings from the flair search listing"""
         try:
-            # Use search with flair filter
-            search_url = f"{self.base_url}/search"
-            params = {
-                'q': f'flair:"{flair_name}"',
-                'restrict_sr': 'on',
-                'sort': 'new',
-                'limit': 25
-            }
-
-            # Construct URL with parameters
-            url = f"{search_url}?q=flair%3A%22{flair_name.replace(' ', '%20')}%22&restrict_sr=on&sort=new&limit=25"
-            data = self._fetch_json(url)
-
             posts = data['data']['children']
 
             for post_data in posts:
                 post = post_data['data']
                 screening = self._parse_post(post, has_screening_flair=True)
                 if screening:
-                    screenings.append(screening)
+                    yield screening
 
         except Exception as e:
             print(f"Error scraping posts by flair '{flair_name}': {e}")
 
-        return screenings
-
-    def _scrape_new_posts(self) -> List[Screening]:
-        """Scrape recent new posts"""
-        screenings = []
+    def _scrape_new_posts(self, data: Dict[str, Any]) -> Iterator[Screening]:
+        """Yield screenings from the recent new posts listing"""
         try:
-            data = self._fetch_json(f"{self.base_url}/new")
             posts = data['data']['children']
 
             week_ago = datetime.now() - timedelta(days=7)
@@ -195,13 +189,11 @@ class RedditScraper(BaseScraper):
 
                 screening = self._parse_post(post)
                 if screening:
-                    screenings.append(screening)
+                    yield screening
 
         except Exception as e:
             print(f"Error scraping new posts: {e}")
 
-        return screenings
-
     def _parse_post(self, post: Dict[str, Any], is_pinned: bool = False,
                     has_screening_flair: bool = False) -> Screening:
         """Parse a Reddit post JSON object into a Screening"""
@@ -210,19 +202,20 @@ class RedditScraper(BaseScraper):
             selftext = post.get('selftext', '')
             permalink = post['permalink']
 
-            # Combined text for analysis
+            # Combined text for analysis (lowercased once for the keyword helpers)
             full_text = f"{title} {selftext}"
+            text_lower = full_text.lower()
 
             # Check if it's about a special screening (unless pinned or has screening flair)
             if not is_pinned and not has_screening_flair:
-                if not self._is_special_screening(full_text):
+                if not self._is_special_screening(text_lower):
                     return None
 
             # Extract information
             description = selftext[:500] if selftext else ''
-            theater = self._extract_theater(full_text)
+            theater = self._extract_theater(text_lower)
             date_str = self._extract_date(full_text)
-            special_note = self._extract_special_notes(full_text)
+            special_note = self._extract_special_notes(text_lower)
 
             # Extract ticket availability
             ticket_status, ticket_sale_date = self.extract_ticket_availability(full_text)
@@ -254,65 +247,52 @@ class RedditScraper(BaseScraper):
         title = re.sub(r'\(.*?theater.*?\)', '', title, flags=re.I)
         return title.strip()
 
-    def _extract_theater(self, text: str) -> str:
-        """Try to extract theater name from text"""
-        theaters = [
-            'AMC Lincoln Square', 'AMC 84th', 'Paris Theater', 'Angelika',
-            'Film Forum', 'IFC Center', 'Metrograph', 'Alamo Drafthouse',
-            'Anthology', 'BAM', 'Quad', 'Nitehawk'
-        ]
-
-        text_lower = text.lower()
-        for theater in theaters:
-            if theater.lower() in text_lower:
+    def _extract_theater(self, text_lower: str) -> str:
+        """Try to extract theater name from lowercased text"""
+        found = _THEATER_MATCHER.find(text_lower)
+        for theater in THEATERS:
+            if theater in found:
                 return theater
 
         return 'Check Post'
 
     def _extract_date(self, text: str) -> str:
         """Try to extract date from text"""
-        import re
-
-        # Look for common date patterns
-        patterns = [
-            r'\d{1,2}/\d{1,2}',  # MM/DD
-            r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{1,2}',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.I)
-            if match:
-                return match.group(0)
-
-        return ''
-
-    def _extract_special_notes(self, text: str) -> str:
-        """Extract special screening notes"""
+        # Single scan over the text; prefer MM/DD, then weekday, then month name
+        best_rank, best_date = len(_DATE_FORMATS), ''
+        for match in _DATE_RE.finditer(text):
+            rank = _DATE_FORMATS.index(match.lastgroup)
+            if rank < best_rank:
+                best_rank, best_date = rank, match.group(0)
+                if rank == 0:
+                    break
+
+        return best_date
+
+    def _extract_special_notes(self, text_lower: str) -> str:
+        """Extract special screening notes from lowercased text"""
         notes = []
-        text_lower = text.lower()
+        found = _NOTE_MATCHER.find(text_lower)
 
-        if any(word in text_lower for word in ['q&a', 'q & a']):
+        if any(word in found for word in ['q&a', 'q & a']):
             notes.append('Q&A')
-        if 'director' in text_lower and any(word in text_lower for word in ['appearance', 'present']):
+        if 'director' in found and any(word in found for word in ['appearance', 'present']):
             notes.append('Director Appearance')
-        if 'imax' in text_lower:
+        if 'imax' in found:
             notes.append('IMAX')
-        if '70mm' in text_lower:
+        if '70mm' in found:
             notes.append('70mm')
-        if 'premiere' in text_lower:
+        if 'premiere' in found:
             notes.append('Premiere')
-        if 'advance screening' in text_lower or 'early screening' in text_lower:
+        if 'advance screening' in found or 'early screening' in found:
             notes.append('Advance Screening')
-        if 'free' in text_lower and 'ticket' in text_lower:
+        if 'free' in found and 'ticket' in found:
             notes.append('Free Tickets')
 
         return ' | '.join(notes) if notes else 'Community Post'
 
-    def _is_special_screening(self, text: str) -> bool:
-        """Check if post is about a special screening"""
-        text_lower = text.lower()
-
+    def _is_special_screening(self, text_lower: str) -> bool:
+        """Check if post is about a special screening (expects lowercased text)"""
         # Keywords that indicate special screening
         special_keywords = [
             'screening', 'q&a', 'premiere', 'director', 'imax',
@@ -4,8 +4,19 @@ Scraper for The Roxy Cinema
 from typing import List
 from .base import BaseScraper, Screening
 from config import get_theater_url
+from itertools import islice
+from keyword_matcher import KeywordMatcher
 import re
 
+_NOTE_MATCHER = KeywordMatcher([
+    'q&a', 'q & a', '+ q&a', '+ intro', 'introduction',
+    'director', 'appearance', 'present', 'person', 'attendance', 'intro',
+    '35mm', '70mm', '16mm', 'restoration', 'restored', '4k',
+    'premiere', 'opening', 'midnight', 'making waves',
+    'retrospective', 'series', 'festival', 'repertory', 'revival', 'classic',
+    'exclusive'
+])
+
 
 class RoxyCinemaScraper(BaseScraper):
     """Scrapes The Roxy Cinema (Tribeca arthouse theater)"""
@@ -37,7 +48,7 @@ class RoxyCinemaScraper(BaseScraper):
             film_elements = soup.find_all(['div', 'article'],
                                          class_=re.compile(r'detailed-screening__card|rb-event__articles', re.I))
 
-            for element in film_elements[:40]:  # Get more items since it's a carousel
+            for element in islice(film_elements, 40):  # Get more items since it's a carousel
                 try:
                     screening = self._parse_film(element)
                     if screening:
@@ -65,11 +76,12 @@ class RoxyCinemaScraper(BaseScraper):
         # Filter out non-film content (buttons, notices, etc.)
         if not title or len(title) < 3:
             return None
+        title_lower = title.lower()
         # Skip common button text and notices
-        if title.lower() in ['buy', 'read more', 'view all', 'tickets']:
+        if title_lower in ['buy', 'read more', 'view all', 'tickets']:
             return None
         # Skip obvious notices/announcements
-        if 'complete listing' in title.lower() or 'announced soon' in title.lower():
+        if 'complete listing' in title_lower or 'announced soon' in title_lower:
             return None
 
         # Extract description
@@ -86,7 +98,7 @@ class RoxyCinemaScraper(BaseScraper):
 
         # Determine special notes
         full_text = element.get_text()
-        special_note = self._determine_special_note(full_text, title)
+        special_note = self._determine_special_note(full_text.lower(), title_lower)
 
         # Extract URL - pattern is /screenings/[film-title-slug]/
         link = element.find('a', href=True)
@@ -109,54 +121,54 @@ class RoxyCinemaScraper(BaseScraper):
             priority=1  # Roxy Cinema is a curated arthouse theater
         )
 
-    def _determine_special_note(self, text: str, title: str = '') -> str:
-        """Determine what makes this screening special"""
+    def _determine_special_note(self, text_lower: str, title_lower: str = '') -> str:
+        """Determine what makes this screening special (expects lowercased text and title)"""
         notes = []
-        text_lower = text.lower()
-        title_lower = title.lower()
+        found = _NOTE_MATCHER.find(text_lower)
+        title_found = _NOTE_MATCHER.find(title_lower)
 
         # Check for Q&A
-        if any(word in text_lower for word in ['q&a', 'q & a', '+ q&a']):
+        if any(word in found for word in ['q&a', 'q & a', '+ q&a']):
             notes.append('Q&A')
 
         # Check for introductions
-        if '+ intro' in text_lower or 'introduction' in text_lower:
+        if '+ intro' in found or 'introduction' in found:
             notes.append('Intro')
 
         # Check for director presence
-        if 'director' in text_lower and any(word in text_lower for word in ['appearance', 'present', 'person', 'attendance', 'intro']):
+        if 'director' in found and any(word in found for word in ['appearance', 'present', 'person', 'attendance', 'intro']):
             notes.append('Director Appearance')
 
         # Check for film formats
-        if '35mm' in text_lower or '35mm' in title_lower:
+        if '35mm' in found or '35mm' in title_found:
             notes.append('35mm')
-        if '70mm' in text_lower or '70mm' in title_lower:
+        if '70mm' in found or '70mm' in title_found:
             notes.append('70mm')
-        if '16mm' in text_lower or '16mm' in title_lower:
+        if '16mm' in found or '16mm' in title_found:
             notes.append('16mm')
 
         # Check for restorations
-        if 'restoration' in text_lower or 'restored' in text_lower or '4k' in text_lower:
+        if 'restoration' in found or 'restored' in found or '4k' in found:
             notes.append('Restoration')
 
         # Check for special events
-        if 'premiere' in text_lower or 'opening' in text_lower:
+        if 'premiere' in found or 'opening' in found:
             notes.append('Premiere')
-        if 'midnight' in text_lower:
+        if 'midnight' in found:
             notes.append('Midnight Screening')
 
         # Check for curated series (Roxy has "Making Waves:" and other series)
-        if 'making waves' in text_lower:
+        if 'making waves' in found:
             notes.append('Making Waves Series')
-        if any(word in text_lower for word in ['retrospective', 'series', 'festival']):
+        if any(word in found for word in ['retrospective', 'series', 'festival']):
             notes.append('Special Series')
 
         # Check for repertory/classics
-        if any(word in text_lower for word in ['repertory', 'revival', 'classic']):
+        if any(word in found for word in ['repertory', 'revival', 'classic']):
             notes.append('Repertory')
 
         # Check for exclusive screenings
-        if 'exclusive' in text_lower:
+        if 'exclusive' in found:
             notes.append('Exclusive')
 
         return ' | '.join(notes) if notes else 'Curated Screening'
@@ -2,55 +2,106 @@
 Scraper for screenslate.com - comprehensive NYC film screening aggregator
 """
 from typing import List
-from .base import BaseScraper, Screening
-from config import get_theater_url
+from .base import BaseScraper, Screening, FAST_PARSE
+from bs4 import SoupStrainer
+from config import get_theater_url, PRIORITY_THEATERS
 from datetime import datetime, timedelta
+from keyword_matcher import KeywordMatcher
 import re
 
+# Priority theaters are never filtered out; art house theaters are always relevant
+_PRIORITY_THEATER_MATCHER = KeywordMatcher(PRIORITY_THEATERS)
+_ART_HOUSE_THEATER_MATCHER = KeywordMatcher(['film forum', 'ifc', 'metrograph', 'anthology', 'paris', 'angelika'])
+
+_NOTE_MATCHER = KeywordMatcher([
+    'imax', 'dolby', '70mm', '35mm', '16mm',
+    'q&a', 'q & a', 'q and a',
+    'director', 'with director', 'director in person', 'director present',
+    'filmmaker', 'with filmmaker', 'filmmaker in person', 'filmmaker present',
+    'appearance', 'present', 'attendance', 'in person',
+    'opening night', 'premiere', 'sneak preview', 'sneak peek',
+    'advance screening', 'early access', 'festival',
+    'repertory', 'retrospective', 'classics', 'revival',
+    'restoration', 'restored', '4k', 'anniversary', 'th anniversary'
+])
+
+# CSS selectors for tile parsing (soupsieve compiles and caches each one on first use)
+_FALLBACK_TILE_SELECTOR = (
+    ':is(article, div):is([class*=screening i], [class*=listing i], '
+    '[class*=event i], [class*=tile i], [class*=card i])'
+)
+_TITLE_SELECTOR = 'h3, h4, h2, h1'
+_TITLE_LINK_SELECTOR = 'a:is([class*=title i], [class*=film i], [class*=screening i])'
+_VENUE_SELECTOR = (
+    ':is(span, div, p, a):is([class*=venue i], [class*=theater i], '
+    '[class*=location i], [class*=cinema i])'
+)
+_VENUE_LINK_SELECTOR = 'a[href*="/venues/" i]'
+
+# CSS equivalents of the class/href matchers below, for the selectolax path
+_DATE_SELECTOR = ':is(span, div):is([class*=date i], [class*=time i], [class*=when i], [class*=showtime i])'
+_DESC_SELECTOR = (
+    ':is(p, div):is([class*=description i], [class*=synopsis i], '
+    '[class*=summary i], [class*=about i])'
+)
+_SCREENING_LINK_SELECTOR = 'a[href*="/screenings/" i]'
+
+# Class and href matchers, compiled once instead of per tile
+_DATE_RE = re.compile(r'date|time|when|showtime', re.I)
+_DESC_RE = re.compile(r'description|synopsis|summary|about', re.I)
+_SCREENING_LINK_RE = re.compile(r'/screenings/', re.I)
+
+# Only build the tile subtrees into the soup - covers both article.tile and the
+# fallback selector, so everything scrape() looks for survives the strainer.
+# BeautifulSoup path only: selectolax (the default) always parses the whole page.
+_TILE_STRAINER = SoupStrainer(['article', 'div'], class_=re.compile(r'screening|listing|event|tile|card', re.I))
+
 
 class ScreenslateScraper(BaseScraper):
     """Scrapes screenslate.com for NYC special screenings"""
 
-    def __init__(self):
+    def __init__(self, max_results: int = 60):
         super().__init__('Screenslate')
         self.base_url = 'https://www.screenslate.com'
+        # Stop parsing tiles once this many relevant screenings are collected
+        self.max_results = max_results
 
     def scrape(self) -> List[Screening]:
         """Scrape screenslate for upcoming special screenings"""
         screenings = []
 
         try:
-            # Screenslate has a clean listings page - uses JavaScript rendering
+            # Screenslate has a clean listings page - try the static HTML first and
+            # only render it with Playwright if the article.tile cards are missing
             url = f'{self.base_url}/listings'
-            print("  Using Playwright to render JavaScript content...")
-
-            # Use JS rendering - wait for article tiles which are the screening cards
-            # Screenslate uses article.tile for each screening
-            soup = self.fetch_page_js(url, wait_selector='article.tile')
-
-            if not soup:
-                print("  Playwright failed, falling back to regular fetch...")
-                soup = self.fetch_page(url)
+            soup = self.fetch_page_static_first(url, wait_selector='article.tile',
+                                               parse_only=None if FAST_PARSE else _TILE_STRAINER, fast=True)
 
             if not soup:
                 return screenings
 
+            # With FAST_PARSE the page is a selectolax tree, parsed by _parse_screening_node
+            select = soup.css if FAST_PARSE else soup.select
+            parse_screening = self._parse_screening_node if FAST_PARSE else self._parse_screening
+
             # Find all screening entries
             # Screenslate uses article.tile for each screening card
-            screening_elements = soup.find_all('article', class_='tile')
+            screening_elements = select('article.tile')
 
             # Fallback to other patterns if no tiles found
             if not screening_elements:
                 print("  No article.tile elements found, trying broader search...")
-                screening_elements = soup.find_all(['article', 'div'], class_=re.compile(r'screening|listing|event|tile|card', re.I))
+                screening_elements = select(_FALLBACK_TILE_SELECTOR)
 
             print(f"  Found {len(screening_elements)} potential screening elements")
 
-            for element in screening_elements[:100]:  # Increased limit to get more screenings
+            for element in screening_elements:
                 try:
-                    screening = self._parse_screening(element)
-                    if screening and self._is_relevant(screening):
+                    screening = parse_screening(element)
+                    if screening:
                         screenings.append(screening)
+                        if len(screenings) >= self.max_results:
+                            break
                 except Exception as e:
                     print(f"  Error parsing screening: {e}")
                     continue
@@ -61,11 +112,17 @@ class ScreenslateScraper(BaseScraper):
         return screenings
 
     def _parse_screening(self, element) -> Screening:
-        """Parse a single screening element"""
+        """
+        Parse a single screening element
+
+        Returns None for tiles without a title or that are not relevant. Relevance
+        only needs the theater and special notes, so it is checked before the
+        remaining fields are extracted.
+        """
         # Extract title - Screenslate uses h3 or h4 for film titles in tiles
-        title_elem = element.find(['h3', 'h4', 'h2', 'h1'])
+        title_elem = element.select_one(_TITLE_SELECTOR)
         if not title_elem:
-            title_elem = element.find('a', class_=re.compile(r'title|film|screening', re.I))
+            title_elem = element.select_one(_TITLE_LINK_SELECTOR)
         if not title_elem:
             title_elem = element.find('a')
 
@@ -76,18 +133,27 @@ class ScreenslateScraper(BaseScraper):
             return None
 
         # Extract theater/venue - look for venue/theater in spans or divs
-        theater_elem = element.find(['span', 'div', 'p', 'a'], class_=re.compile(r'venue|theater|location|cinema', re.I))
+        theater_elem = element.select_one(_VENUE_SELECTOR)
         if not theater_elem:
             # Sometimes venue is in a link
-            venue_link = element.find('a', href=re.compile(r'/venues/', re.I))
+            venue_link = element.select_one(_VENUE_LINK_SELECTOR)
             theater_elem = venue_link if venue_link else None
 
         theater = theater_elem.get_text(strip=True) if theater_elem else 'Venue TBA'
 
+        # Determine special notes
+        full_text = element.get_text()
+        text_lower = full_text.lower()
+        special_note = self._extract_special_notes(text_lower)
+
+        # Skip irrelevant tiles before doing any more extraction work
+        if not self._is_relevant(theater, special_note):
+            return None
+
         # Extract date/time - Screenslate often uses time tags or date classes
         date_elem = element.find('time')
         if not date_elem:
-            date_elem = element.find(['span', 'div'], class_=re.compile(r'date|time|when|showtime', re.I))
+            date_elem = element.find(['span', 'div'], class_=_DATE_RE)
 
         date_str = ''
         if date_elem:
@@ -95,11 +161,11 @@ class ScreenslateScraper(BaseScraper):
             date_str = date_elem.get('datetime', '') or date_elem.get_text(strip=True)
 
         # Extract description - look for synopsis or description
-        desc_elem = element.find(['p', 'div'], class_=re.compile(r'description|synopsis|summary|about', re.I))
+        desc_elem = element.find(['p', 'div'], class_=_DESC_RE)
         description = desc_elem.get_text(strip=True)[:200] if desc_elem else ''
 
         # Extract link - prioritize links to the screening page
-        link_elem = element.find('a', href=re.compile(r'/screenings/', re.I))
+        link_elem = element.find('a', href=_SCREENING_LINK_RE)
         if not link_elem:
             link_elem = element.find('a', href=True)
 
@@ -108,16 +174,75 @@ class ScreenslateScraper(BaseScraper):
             href = link_elem['href']
             url = self.base_url + href if href.startswith('/') else href
 
+        # Extract ticket availability
+        ticket_status, ticket_sale_date = self.extract_ticket_availability(full_text)
+
+        # Ensure every screening has a ticket URL (fallback to theater or Screenslate homepage)
+        if not url:
+            # Try to get URL for the specific theater
+            theater_url = get_theater_url(theater)
+            url = theater_url if theater_url else self.base_url
+
+        return Screening(
+            title=title,
+            theater=theater,
+            date=date_str,
+            description=description,
+            special_note=special_note,
+            url=url,
+            priority=2,
+            tickets_on_sale=ticket_status,
+            ticket_sale_date=ticket_sale_date
+        )
+
+    def _parse_screening_node(self, node) -> Screening:
+        """Parse a single screening element from a selectolax tree (same rules as _parse_screening)"""
+        find = self.css_first_within
+
+        # Extract title
+        title_elem = (find(node, _TITLE_SELECTOR) or find(node, _TITLE_LINK_SELECTOR)
+                      or find(node, 'a'))
+        title = title_elem.text(strip=True) if title_elem else ''
+
+        # Skip if no title found
+        if not title:
+            return None
+
+        # Extract theater/venue
+        theater_elem = find(node, _VENUE_SELECTOR) or find(node, _VENUE_LINK_SELECTOR)
+        theater = theater_elem.text(strip=True) if theater_elem else 'Venue TBA'
+
         # Determine special notes
-        full_text = element.get_text()
-        special_note = self._extract_special_notes(full_text)
+        full_text = node.text()
+        special_note = self._extract_special_notes(full_text.lower())
+
+        # Skip irrelevant tiles before doing any more extraction work
+        if not self._is_relevant(theater, special_note):
+            return None
+
+        # Extract date/time - prefer the datetime attribute of a time tag
+        date_elem = find(node, 'time') or find(node, _DATE_SELECTOR)
+        date_str = ''
+        if date_elem:
+            date_str = date_elem.attributes.get('datetime') or date_elem.text(strip=True)
+
+        # Extract description
+        desc_elem = find(node, _DESC_SELECTOR)
+        description = desc_elem.text(strip=True)[:200] if desc_elem else ''
+
+        # Extract link - prioritize links to the screening page
+        link_elem = find(node, _SCREENING_LINK_SELECTOR) or find(node, 'a[href]')
+
+        url = ''
+        href = link_elem.attributes.get('href') if link_elem else None
+        if href:
+            url = self.base_url + href if href.startswith('/') else href
 
         # Extract ticket availability
         ticket_status, ticket_sale_date = self.extract_ticket_availability(full_text)
 
         # Ensure every screening has a ticket URL (fallback to theater or Screenslate homepage)
         if not url:
-            # Try to get URL for the specific theater
             theater_url = get_theater_url(theater)
             url = theater_url if theater_url else self.base_url
 
@@ -133,83 +258,80 @@ class ScreenslateScraper(BaseScraper):
             ticket_sale_date=ticket_sale_date
         )
 
-    def _extract_special_notes(self, text: str) -> str:
-        """Extract special screening information (enhanced detection)"""
+    def _extract_special_notes(self, text_lower: str) -> str:
+        """Extract special screening information from lowercased text (enhanced detection)"""
         notes = []
-        text_lower = text.lower()
+        found = _NOTE_MATCHER.find(text_lower)
 
         # Film formats
-        if 'imax' in text_lower:
+        if 'imax' in found:
             notes.append('IMAX')
-        if 'dolby' in text_lower:
+        if 'dolby' in found:
             notes.append('Dolby')
-        if '70mm' in text_lower:
+        if '70mm' in found:
             notes.append('70mm')
-        if '35mm' in text_lower:
+        if '35mm' in found:
             notes.append('35mm')
-        if '16mm' in text_lower:
+        if '16mm' in found:
             notes.append('16mm')
 
         # Q&A (enhanced)
-        if any(word in text_lower for word in ['q&a', 'q & a', 'q and a']):
+        if any(word in found for word in ['q&a', 'q & a', 'q and a']):
             notes.append('Q&A')
 
         # Director appearances (enhanced)
-        if any(word in text_lower for word in ['with director', 'director in person', 'director present']):
+        if any(word in found for word in ['with director', 'director in person', 'director present']):
             notes.append('Director Appearance')
-        elif 'director' in text_lower and any(word in text_lower for word in ['appearance', 'present', 'attendance', 'in person']):
+        elif 'director' in found and any(word in found for word in ['appearance', 'present', 'attendance', 'in person']):
             notes.append('Director Appearance')
 
         # Filmmaker appearances (new)
-        if any(word in text_lower for word in ['with filmmaker', 'filmmaker in person', 'filmmaker present']):
+        if any(word in found for word in ['with filmmaker', 'filmmaker in person', 'filmmaker present']):
             notes.append('Filmmaker Appearance')
-        elif 'filmmaker' in text_lower and any(word in text_lower for word in ['appearance', 'present', 'in person']):
+        elif 'filmmaker' in found and any(word in found for word in ['appearance', 'present', 'in person']):
             notes.append('Filmmaker Appearance')
 
         # Premieres and special events (enhanced)
-        if 'opening night' in text_lower:
+        if 'opening night' in found:
             notes.append('Opening Night')
-        elif 'premiere' in text_lower:
+        elif 'premiere' in found:
             notes.append('Premiere')
 
         # Preview screenings (new)
-        if any(word in text_lower for word in ['sneak preview', 'sneak peek']):
+        if any(word in found for word in ['sneak preview', 'sneak peek']):
             notes.append('Sneak Preview')
-        elif any(word in text_lower for word in ['advance screening', 'early access']):
+        elif any(word in found for word in ['advance screening', 'early access']):
             notes.append('Advance Screening')
 
         # Festival and series
-        if 'festival' in text_lower:
+        if 'festival' in found:
             notes.append('Festival Screening')
-        if any(word in text_lower for word in ['repertory', 'retrospective', 'classics', 'revival']):
+        if any(word in found for word in ['repertory', 'retrospective', 'classics', 'revival']):
             notes.append('Repertory')
 
         # Restorations and anniversaries
-        if any(word in text_lower for word in ['restoration', 'restored', '4k']):
+        if any(word in found for word in ['restoration', 'restored', '4k']):
             notes.append('Restoration')
-        if any(word in text_lower for word in ['anniversary', 'th anniversary']):
+        if any(word in found for word in ['anniversary', 'th anniversary']):
             notes.append('Anniversary')
 
         return ' | '.join(notes) if notes else ''
 
-    def _is_relevant(self, screening: Screening) -> bool:
-        """Check if screening is relevant (Manhattan, special event)"""
-        # Import priority theaters configuration
-        from config import PRIORITY_THEATERS
+    def _is_relevant(self, theater: str, special_note: str) -> bool:
+        """Check if a screening at this theater with these notes is relevant (Manhattan, special event)"""
+        theater_lower = theater.lower()
 
         # NEVER filter out priority theaters
-        if any(priority_theater.lower() in screening.theater.lower()
-               for priority_theater in PRIORITY_THEATERS):
+        if _PRIORITY_THEATER_MATCHER.find(theater_lower):
             return True
 
         # Skip if Brooklyn (unless explicitly special)
-        if 'brooklyn' in screening.theater.lower() and not screening.special_note:
+        if 'brooklyn' in theater_lower and not special_note:
             return False
 
         # Include if it has special notes or is from a known art house theater
-        if screening.special_note:
+        if special_note:
             return True
 
         # Include if from repertory/art house theaters
-        art_house_theaters = ['film forum', 'ifc', 'metrograph', 'anthology', 'paris', 'angelika']
-        return any(theater in screening.theater.lower() for theater in art_house_theaters)
+        return bool(_ART_HOUSE_THEATER_MATCHER.find(theater_lower))
@@ -2,10 +2,48 @@
 Scraper for Time Out NYC film events
 """
 from typing import List
-from .base import BaseScraper, Screening
-from config import get_theater_url
+from .base import BaseScraper, Screening, FAST_PARSE
+from bs4 import SoupStrainer
+from config import get_theater_url, PRIORITY_THEATERS
+from keyword_matcher import KeywordMatcher
 import re
 
+# Class matchers, compiled once instead of per event element
+_KNOWN_TITLE_CLASS_RE = re.compile(r'^_h3_')  # Current layout: <h3 class="_h3_c6c0h_1">
+_TILE_RE = re.compile(r'tile|article', re.I)
+_LISTING_RE = re.compile(r'event|card|listing|film', re.I)
+_HEADING_RE = re.compile(r'_h\d|title|heading', re.I)
+_TITLE_RE = re.compile(r'title|name', re.I)
+_VENUE_RE = re.compile(r'venue|location|theater', re.I)
+_DESC_RE = re.compile(r'description|summary|excerpt', re.I)
+_DATE_RE = re.compile(r'date|time|when', re.I)
+
+# CSS equivalents of the class matchers above, for the selectolax path
+_KNOWN_TITLE_SELECTOR = 'h3[class^="_h3_"]'
+_TILE_SELECTOR = 'article:is([class*=tile i], [class*=article i])'
+_LISTING_SELECTOR = ':is(div, li):is([class*=event i], [class*=card i], [class*=listing i], [class*=film i])'
+_HEADING_SELECTOR = (
+    ':is(h3, h2, h4):is(' + ', '.join(f'[class*=_h{digit} i]' for digit in range(10))
+    + ', [class*=title i], [class*=heading i])'
+)
+_TITLE_SELECTOR = 'a:is([class*=title i], [class*=name i])'
+_VENUE_SELECTOR = ':is(span, div, p, a):is([class*=venue i], [class*=location i], [class*=theater i])'
+_DESC_SELECTOR = ':is(p, div):is([class*=description i], [class*=summary i], [class*=excerpt i])'
+_DATE_SELECTOR = ':is(time, span, div):is([class*=date i], [class*=time i], [class*=when i])'
+
+# Only build article tiles and fallback listing elements into the soup.
+# BeautifulSoup path only: selectolax (the default) always parses the whole page.
+_EVENT_STRAINER = SoupStrainer(['article', 'div', 'li'], class_=re.compile(r'tile|article|event|card|listing|film', re.I))
+
+# Priority theaters are never filtered out; specialty theaters count as special
+_PRIORITY_THEATER_MATCHER = KeywordMatcher(PRIORITY_THEATERS)
+_SPECIALTY_THEATER_MATCHER = KeywordMatcher(['film forum', 'ifc', 'metrograph', 'angelika', 'paris', 'anthology'])
+
+_NOTE_MATCHER = KeywordMatcher([
+    'q&a', 'q & a', 'director', 'appearance', 'imax', '70mm', '35mm',
+    'premiere', 'festival', 'screening', 'special', 'advance', 'early'
+])
+
 
 class TimeOutScraper(BaseScraper):
     """Scrapes Time Out NYC for film events"""
@@ -19,30 +57,38 @@ class TimeOutScraper(BaseScraper):
         screenings = []
 
         try:
-            # Time Out has film events section - uses JavaScript rendering
+            # Time Out has film events section - try the static HTML first and
+            # only render it with Playwright if the article tiles are missing
             url = f'{self.base_url}/newyork/film'
-            print("  Using Playwright to render JavaScript content...")
-
-            # Use JS rendering and wait for article tiles to load
-            soup = self.fetch_page_js(url, wait_selector='article')
+            soup = self.fetch_page_static_first(url, wait_selector='article',
+                                               parse_only=None if FAST_PARSE else _EVENT_STRAINER, fast=True)
 
             if not soup:
-                print("  Failed to render page with JavaScript")
+                print("  Failed to fetch Time Out film page")
                 return screenings
 
             # Find event listings - Time Out uses article.tile structure
             # Based on diagnostics: <article class="tile _article_wkzyo_1">
-            event_elements = soup.find_all('article', class_=re.compile(r'tile|article', re.I))
+            # With FAST_PARSE the page is a selectolax tree, parsed by _parse_event_node
+            if FAST_PARSE:
+                event_elements = soup.css(_TILE_SELECTOR)
+                parse_event = self._parse_event_node
+            else:
+                event_elements = soup.find_all('article', class_=_TILE_RE)
+                parse_event = self._parse_event
 
             print(f"  Found {len(event_elements)} article elements")
 
             # Fallback to other structures if needed
             if not event_elements:
-                event_elements = soup.find_all(['div', 'li'], class_=re.compile(r'event|card|listing|film', re.I))
+                if FAST_PARSE:
+                    event_elements = soup.css(_LISTING_SELECTOR)
+                else:
+                    event_elements = soup.find_all(['div', 'li'], class_=_LISTING_RE)
 
             for element in event_elements[:30]:
                 try:
-                    screening = self._parse_event(element)
+                    screening = parse_event(element)
                     if screening and self._is_special(screening):
                         screenings.append(screening)
                 except Exception as e:
@@ -58,9 +104,12 @@ class TimeOutScraper(BaseScraper):
         """Parse an event element"""
         # Extract title - Time Out uses h3 with specific classes
         # Based on diagnostics: <h3 class="_h3_c6c0h_1">Review: Frankenstein</h3>
-        title_elem = element.find(['h3', 'h2', 'h4'], class_=re.compile(r'_h\d|title|heading', re.I))
+        # Try that exact class first; the generic matchers are for layout changes
+        title_elem = element.find('h3', class_=_KNOWN_TITLE_CLASS_RE)
         if not title_elem:
-            title_elem = element.find('a', class_=re.compile(r'title|name', re.I))
+            title_elem = element.find(['h3', 'h2', 'h4'], class_=_HEADING_RE)
+        if not title_elem:
+            title_elem = element.find('a', class_=_TITLE_RE)
         if not title_elem:
             title_elem = element.find(['h2', 'h3', 'h4', 'a'])
 
@@ -72,15 +121,15 @@ class TimeOutScraper(BaseScraper):
             return None
 
         # Extract venue
-        venue_elem = element.find(['span', 'div', 'p', 'a'], class_=re.compile(r'venue|location|theater', re.I))
+        venue_elem = element.find(['span', 'div', 'p', 'a'], class_=_VENUE_RE)
         theater = venue_elem.get_text(strip=True) if venue_elem else 'Venue TBA'
 
         # Extract description
-        desc_elem = element.find(['p', 'div'], class_=re.compile(r'description|summary|excerpt', re.I))
+        desc_elem = element.find(['p', 'div'], class_=_DESC_RE)
         description = desc_elem.get_text(strip=True)[:200] if desc_elem else ''
 
         # Extract date/time
-        date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time|when', re.I))
+        date_elem = element.find(['time', 'span', 'div'], class_=_DATE_RE)
         date_str = date_elem.get_text(strip=True) if date_elem else ''
 
         # Determine special notes
@@ -114,36 +163,90 @@ class TimeOutScraper(BaseScraper):
             ticket_sale_date=ticket_sale_date
         )
 
+    def _parse_event_node(self, node) -> Screening:
+        """Parse an event element from a selectolax tree (same rules as _parse_event)"""
+        find = self.css_first_within
+
+        # Extract title - the current layout's class first, then the generic selectors
+        title_elem = (find(node, _KNOWN_TITLE_SELECTOR) or find(node, _HEADING_SELECTOR)
+                      or find(node, _TITLE_SELECTOR) or find(node, 'h2, h3, h4, a'))
+        if not title_elem:
+            return None
+
+        title = title_elem.text(strip=True)
+        if not title or len(title) < 3:
+            return None
+
+        # Extract venue
+        venue_elem = find(node, _VENUE_SELECTOR)
+        theater = venue_elem.text(strip=True) if venue_elem else 'Venue TBA'
+
+        # Extract description
+        desc_elem = find(node, _DESC_SELECTOR)
+        description = desc_elem.text(strip=True)[:200] if desc_elem else ''
+
+        # Extract date/time
+        date_elem = find(node, _DATE_SELECTOR)
+        date_str = date_elem.text(strip=True) if date_elem else ''
+
+        # Determine special notes
+        full_text = node.text()
+        special_note = self._determine_special_note(full_text)
+
+        # Extract ticket availability
+        ticket_status, ticket_sale_date = self.extract_ticket_availability(full_text)
+
+        # Extract URL
+        link = find(node, 'a[href]')
+        url = (link.attributes.get('href') or '') if link else ''
+        if url and not url.startswith('http'):
+            url = self.base_url + url
+
+        # Ensure every screening has a ticket URL (fallback to theater or Time Out homepage)
+        if not url:
+            theater_url = get_theater_url(theater)
+            url = theater_url if theater_url else self.base_url
+
+        return Screening(
+            title=title,
+            theater=theater,
+            date=date_str,
+            description=description,
+            special_note=special_note,
+            url=url,
+            priority=3,
+            tickets_on_sale=ticket_status,
+            ticket_sale_date=ticket_sale_date
+        )
+
     def _determine_special_note(self, text: str) -> str:
         """Determine what makes this screening special"""
         notes = []
-        text_lower = text.lower()
+        found = _NOTE_MATCHER.find(text.lower())
 
-        if any(word in text_lower for word in ['q&a', 'q & a']):
+        if any(word in found for word in ['q&a', 'q & a']):
             notes.append('Q&A')
-        if 'director' in text_lower and 'appearance' in text_lower:
+        if 'director' in found and 'appearance' in found:
             notes.append('Director Appearance')
-        if 'imax' in text_lower:
+        if 'imax' in found:
             notes.append('IMAX')
-        if '70mm' in text_lower or '35mm' in text_lower:
+        if '70mm' in found or '35mm' in found:
             notes.append('Film Print')
-        if 'premiere' in text_lower:
+        if 'premiere' in found:
             notes.append('Premiere')
-        if 'festival' in text_lower:
+        if 'festival' in found:
             notes.append('Festival')
-        if 'screening' in text_lower and any(word in text_lower for word in ['special', 'advance', 'early']):
+        if 'screening' in found and any(word in found for word in ['special', 'advance', 'early']):
             notes.append('Special Screening')
 
         return ' | '.join(notes) if notes else ''
 
     def _is_special(self, screening: Screening) -> bool:
         """Check if this is a special screening worth including"""
-        # Import priority theaters configuration
-        from config import PRIORITY_THEATERS
+        theater_lower = screening.theater.lower()
 
         # NEVER filter out priority theaters
-        if any(priority_theater.lower() in screening.theater.lower()
-               for priority_theater in PRIORITY_THEATERS):
+        if _PRIORITY_THEATER_MATCHER.find(theater_lower):
             return True
 
         # Must have either special notes or be at a known theater
@@ -151,5 +254,4 @@ class TimeOutScraper(BaseScraper):
             return True
 
         # Check if it's at a known specialty theater
-        specialty_theaters = ['film forum', 'ifc', 'metrograph', 'angelika', 'paris', 'anthology']
-        return any(theater in screening.theater.lower() for theater in specialty_theaters)
+        return bool(_SPECIALTY_THEATER_MATCHER.find(theater_lower))
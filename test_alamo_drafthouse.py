@@ -3,11 +3,14 @@
 Test script for Alamo Drafthouse scraper
 """
 from scrapers.alamo_drafthouse import AlamoDrafthouseScraper
+from scrapers.browser_pool import shared_browser
 
+BANNER = "=" * 60
 
-def test_alamo_drafthouse():
+
+def test_alamo_drafthouse(playwright_browser):
     print("Testing Alamo Drafthouse Lower Manhattan scraper...")
-    print("=" * 60)
+    print(BANNER)
 
     scraper = AlamoDrafthouseScraper()
     screenings = scraper.scrape()
@@ -41,4 +44,4 @@ def test_alamo_drafthouse():
 
 
 if __name__ == '__main__':
-    test_alamo_drafthouse()
+    test_alamo_drafthouse(shared_browser)
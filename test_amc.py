@@ -4,15 +4,17 @@ Quick test of AMC scraper
 """
 from scrapers.amc import AMCScraper
 
-def main():
+BANNER = "=" * 60
+
+def test_amc():
     print("Testing AMC Scraper...")
-    print("=" * 60)
+    print(BANNER)
 
     scraper = AMCScraper()
     screenings = scraper.scrape()
 
     print(f"\nTotal screenings found: {len(screenings)}")
-    print("=" * 60)
+    print(BANNER)
 
     if screenings:
         print("\nSample screenings:")
@@ -32,4 +34,4 @@ def main():
         print("  - Network/Playwright issues")
 
 if __name__ == "__main__":
-    main()
+    test_amc()
@@ -12,14 +12,16 @@ os.environ['SERPAPI_KEY'] = 'e70564af39d1d5496238f4177e2b22cef3d9cd7c5f8ec1d6e91
 from scrapers.amc import AMCScraper
 import time
 
-def test_amc_scraper():
-    """Test AMC scraper with corrected format"""
+BANNER = "=" * 80
+
+def _run_amc_scraper() -> bool:
+    """Test AMC scraper with corrected format - returns True if screenings were found"""
     print("Testing AMC scraper with CORRECTED SerpAPI format")
-    print("=" * 80)
+    print(BANNER)
     print("Query format: 'AMC Lincoln Square 13' (NO 'showtimes' keyword)")
     print("Location format: 'New York, New York, United States'")
     print("Endpoint: search.json")
-    print("=" * 80)
+    print(BANNER)
     print()
 
     scraper = AMCScraper()
@@ -70,6 +72,10 @@ def test_amc_scraper():
         traceback.print_exc()
         return False
 
+def test_amc_scraper(serpapi_key):
+    """Test AMC scraper with corrected format"""
+    assert _run_amc_scraper(), "No screenings found"
+
 if __name__ == '__main__':
-    success = test_amc_scraper()
+    success = _run_amc_scraper()
     sys.exit(0 if success else 1)
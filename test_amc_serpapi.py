@@ -11,10 +11,12 @@ os.environ['SERPAPI_KEY'] = 'e70564af39d1d5496238f4177e2b22cef3d9cd7c5f8ec1d6e91
 
 from scrapers.amc import AMCScraper
 
-def test_single_theater():
-    """Test with just one theater to minimize API usage"""
+BANNER = "=" * 60
+
+def _run_single_theater() -> bool:
+    """Test with just one theater to minimize API usage - returns True if screenings were found"""
     print("Testing AMC scraper with SerpAPI (1 API call only)...")
-    print("=" * 60)
+    print(BANNER)
 
     scraper = AMCScraper()
 
@@ -59,6 +61,10 @@ def test_single_theater():
         traceback.print_exc()
         return False
 
+def test_single_theater(serpapi_key):
+    """Test with just one theater to minimize API usage"""
+    assert _run_single_theater(), "No screenings found"
+
 if __name__ == '__main__':
-    success = test_single_theater()
+    success = _run_single_theater()
     sys.exit(0 if success else 1)
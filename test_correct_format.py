@@ -5,6 +5,8 @@ Test SerpAPI with correct URL format (no 'showtimes' in query)
 import requests
 import json
 
+BANNER = "=" * 80
+
 api_key = 'e70564af39d1d5496238f4177e2b22cef3d9cd7c5f8ec1d6e919223a56ac031b'
 
 # Use the exact format from the example
@@ -19,7 +21,7 @@ params = {
 print("Testing with correct format:")
 print(f"  Query: {params['q']}")
 print(f"  Location: {params['location']}")
-print("=" * 80)
+print(BANNER)
 
 try:
     # Note: using search.json endpoint
@@ -3,44 +3,112 @@
 Test script to verify email configuration
 Run this manually to test that SendGrid is set up correctly
 """
+import argparse
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email_sender import EmailSender
 
+BANNER = "=" * 60
 
-def main():
+# SendGrid rate-limits bursts, so batched sends are spread out and retried with backoff
+SENDS_PER_SECOND = 5
+MAX_SEND_ATTEMPTS = 4
+MAX_SEND_WORKERS = 20
+
+
+class TokenBucket:
+    """Simple thread-safe token bucket: allows `rate` acquisitions per second"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def send_with_retry(sender: EmailSender, bucket: TokenBucket) -> bool:
+    """Send one test email, backing off exponentially if SendGrid rejects it (e.g. 429)"""
+    for attempt in range(MAX_SEND_ATTEMPTS):
+        bucket.acquire()
+        if sender.send_test_email():
+            return True
+        if attempt < MAX_SEND_ATTEMPTS - 1:
+            time.sleep(2 ** attempt)
+    return False
+
+
+def main(argv=None):
     """Send a test email to verify configuration"""
-    print("=" * 60)
-    print("NYC MOVIE SCREENING - EMAIL TEST")
-    print("=" * 60)
-    print("\nThis will send a test email to verify your SendGrid setup.\n")
+    parser = argparse.ArgumentParser(description="Send test emails to verify SendGrid setup")
+    parser.add_argument('--count', type=int, default=1,
+                        help="number of test emails to send (default: 1)")
+    args = parser.parse_args(argv)
+    count = max(args.count, 1)
+
+    sys.stdout.write("\n".join([
+        BANNER,
+        "NYC MOVIE SCREENING - EMAIL TEST",
+        BANNER,
+        "\nThis will send a test email to verify your SendGrid setup.\n",
+    ]) + "\n")
 
     try:
+        # One client for the whole batch
         sender = EmailSender()
-        print(f"Sending test email to: {sender.recipient_email}\n")
 
-        success = sender.send_test_email()
+        if count == 1:
+            print(f"Sending test email to: {sender.recipient_email}\n")
+            success = sender.send_test_email()
+        else:
+            print(f"Sending {count} test emails to: {sender.recipient_email}\n")
+            bucket = TokenBucket(SENDS_PER_SECOND)
+            with ThreadPoolExecutor(max_workers=min(count, MAX_SEND_WORKERS)) as executor:
+                results = list(executor.map(lambda _: send_with_retry(sender, bucket), range(count)))
+            sent = sum(results)
+            print(f"\n{sent}/{count} test emails sent")
+            success = sent == count
 
         if success:
-            print("\n" + "=" * 60)
-            print("✓ SUCCESS! Test email sent!")
-            print("=" * 60)
-            print("\nCheck your inbox (and spam folder) for the test email.")
-            print("If you received it, your setup is complete!")
+            sys.stdout.write("\n".join([
+                "\n" + BANNER,
+                "✓ SUCCESS! Test email sent!",
+                BANNER,
+                "\nCheck your inbox (and spam folder) for the test email.",
+                "If you received it, your setup is complete!",
+            ]) + "\n")
             return 0
         else:
-            print("\n" + "=" * 60)
-            print("✗ FAILED: Could not send test email")
-            print("=" * 60)
-            print("\nTroubleshooting:")
-            print("1. Check that SENDGRID_API_KEY is set correctly")
-            print("2. Verify your SendGrid account is active")
-            print("3. Make sure sender email is verified in SendGrid")
+            sys.stdout.write("\n".join([
+                "\n" + BANNER,
+                "✗ FAILED: Could not send test email",
+                BANNER,
+                "\nTroubleshooting:",
+                "1. Check that SENDGRID_API_KEY is set correctly",
+                "2. Verify your SendGrid account is active",
+                "3. Make sure sender email is verified in SendGrid",
+            ]) + "\n")
             return 1
 
     except ValueError as e:
-        print(f"\n✗ Configuration Error: {e}")
-        print("\nMake sure you've set the SENDGRID_API_KEY environment variable:")
-        print("  export SENDGRID_API_KEY='your-api-key-here'")
+        sys.stdout.write("\n".join([
+            f"\n✗ Configuration Error: {e}",
+            "\nMake sure you've set the SENDGRID_API_KEY environment variable:",
+            "  export SENDGRID_API_KEY='your-api-key-here'",
+        ]) + "\n")
         return 1
     except Exception as e:
         print(f"\n✗ Unexpected Error: {e}")
@@ -1,66 +1,71 @@
 """
 Test script for event classifier to verify enhanced special event detection
 """
+import sys
 from event_classifier import EventClassifier, classify_screening
 
+BANNER = "=" * 60
+
 
 def test_event_classifier():
     """Test the event classifier with various screening descriptions"""
-    print("Testing Event Classifier\n" + "=" * 60)
+    report = ["Testing Event Classifier\n" + BANNER]
 
+    # Expected tags are frozensets built once with the cases, not per comparison
     test_cases = [
         {
             'description': 'Special screening with Q&A with director John Smith',
-            'expected_tags': ['Q&A', 'Director Appearance']
+            'expected_tags': frozenset({'Q&A', 'Director Appearance'})
         },
         {
             'description': 'Opening night premiere with filmmaker in person',
-            'expected_tags': ['Filmmaker Appearance', 'Opening Night']
+            'expected_tags': frozenset({'Filmmaker Appearance', 'Opening Night'})
         },
         {
             'description': 'Sneak preview screening - IMAX',
-            'expected_tags': ['IMAX', 'Sneak Preview']
+            'expected_tags': frozenset({'IMAX', 'Sneak Preview'})
         },
         {
             'description': '70mm restoration for the 25th anniversary',
-            'expected_tags': ['70mm', 'Anniversary', 'Restoration']
+            'expected_tags': frozenset({'70mm', 'Anniversary', 'Restoration'})
         },
         {
             'description': 'Advance screening in Dolby Cinema',
-            'expected_tags': ['Advance Screening', 'Dolby']
+            'expected_tags': frozenset({'Advance Screening', 'Dolby'})
         },
         {
             'description': 'New 4K restoration premiere',
-            'expected_tags': ['Premiere', 'Restoration']
+            'expected_tags': frozenset({'Premiere', 'Restoration'})
         },
         {
             'description': 'Festival screening with Q and A',
-            'expected_tags': ['Festival', 'Q&A']
+            'expected_tags': frozenset({'Festival', 'Q&A'})
         },
         {
             'description': 'Triple feature marathon in 35mm',
-            'expected_tags': ['35mm', 'Fan Event']
+            'expected_tags': frozenset({'35mm', 'Fan Event'})
         },
         {
             'description': 'Director in person for opening night',
-            'expected_tags': ['Director Appearance', 'Opening Night']
+            'expected_tags': frozenset({'Director Appearance', 'Opening Night'})
         },
         {
             'description': 'Sneak peek advance screening',
-            'expected_tags': ['Sneak Preview', 'Advance Screening']
+            'expected_tags': frozenset({'Sneak Preview', 'Advance Screening'})
         }
     ]
 
     passed = 0
     failed = 0
 
-    for i, test_case in enumerate(test_cases, 1):
+    # Classify every description in one call
+    results = EventClassifier.classify_batch([tc['description'] for tc in test_cases])
+
+    for i, (test_case, tags) in enumerate(zip(test_cases, results), 1):
         description = test_case['description']
-        expected_tags = set(test_case['expected_tags'])
+        expected_tags = test_case['expected_tags']
 
-        # Run classifier
-        tags = EventClassifier.classify(description)
-        tags_set = set(tags)
+        tags_set = frozenset(tags)
         formatted = EventClassifier.format_tags(tags)
 
         # Check if all expected tags are present
@@ -75,26 +80,27 @@ def test_event_classifier():
             failed += 1
             status = "✗ FAIL"
 
-        print(f"\nTest {i}: {status}")
-        print(f"  Description: {description}")
-        print(f"  Expected: {', '.join(sorted(expected_tags))}")
-        print(f"  Got: {formatted}")
+        report.append(f"\nTest {i}: {status}")
+        report.append(f"  Description: {description}")
+        report.append(f"  Expected: {', '.join(sorted(expected_tags))}")
+        report.append(f"  Got: {formatted}")
 
         if missing_tags:
-            print(f"  Missing: {', '.join(sorted(missing_tags))}")
+            report.append(f"  Missing: {', '.join(sorted(missing_tags))}")
         if extra_tags and not missing_tags:
-            print(f"  Extra (bonus): {', '.join(sorted(extra_tags))}")
+            report.append(f"  Extra (bonus): {', '.join(sorted(extra_tags))}")
 
-    print("\n" + "=" * 60)
-    print(f"Results: {passed} passed, {failed} failed out of {len(test_cases)} tests")
-    print("=" * 60)
+    report.append("\n" + BANNER)
+    report.append(f"Results: {passed} passed, {failed} failed out of {len(test_cases)} tests")
+    report.append(BANNER)
 
+    sys.stdout.write("\n".join(report) + "\n")
     return failed == 0
 
 
 def test_is_special():
     """Test the is_special convenience method"""
-    print("\n\nTesting is_special() method\n" + "=" * 60)
+    report = ["\n\nTesting is_special() method\n" + BANNER]
 
     test_cases = [
         ('Regular screening at 7pm', False),
@@ -110,24 +116,26 @@ def test_is_special():
     for text, expected in test_cases:
         result = EventClassifier.is_special(text)
         status = "✓" if result == expected else "✗"
-        print(f"{status} '{text}' -> {result} (expected {expected})")
+        report.append(f"{status} '{text}' -> {result} (expected {expected})")
         if result == expected:
             passed += 1
 
-    print("=" * 60)
-    print(f"Results: {passed}/{len(test_cases)} passed")
-    print("=" * 60)
+    report.append(BANNER)
+    report.append(f"Results: {passed}/{len(test_cases)} passed")
+    report.append(BANNER)
+    sys.stdout.write("\n".join(report) + "\n")
 
 
 def test_all_keywords():
     """Display all keywords being tracked"""
-    print("\n\nAll Keywords Tracked\n" + "=" * 60)
+    report = ["\n\nAll Keywords Tracked\n" + BANNER]
 
     for category, keywords in EventClassifier.KEYWORDS.items():
-        print(f"\n{category}:")
-        print(f"  {', '.join(keywords)}")
+        report.append(f"\n{category}:")
+        report.append(f"  {', '.join(keywords)}")
 
-    print("\n" + "=" * 60)
+    report.append("\n" + BANNER)
+    sys.stdout.write("\n".join(report) + "\n")
 
 
 if __name__ == '__main__':
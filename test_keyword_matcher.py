@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Test the Aho-Corasick keyword matcher used by the scrapers
+"""
+from keyword_matcher import KeywordMatcher
+
+
+def test_finds_all_keywords():
+    """Test that every keyword in the text is found, including overlaps"""
+    matcher = KeywordMatcher(['director', 'director in person', 'q&a', 'imax'])
+
+    found = matcher.find('q&a with director in person')
+    assert found == {'director', 'director in person', 'q&a'}, f"Got {found}"
+    print("✓ Test 1 passed: overlapping keywords are all found")
+
+
+def test_returns_keyword_as_given():
+    """Test that matching is case-insensitive but returns the original keyword"""
+    matcher = KeywordMatcher(['Film Forum', 'IFC Center'])
+
+    assert matcher.find('tonight at film forum') == {'Film Forum'}
+    assert matcher.find('regular screening') == set()
+    assert matcher.find('') == set()
+    print("✓ Test 2 passed: keywords returned as given")
+
+
+if __name__ == '__main__':
+    test_finds_all_keywords()
+    test_returns_keyword_as_given()
+    print("✓ All tests passed!")
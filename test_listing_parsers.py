@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Check that the selectolax and BeautifulSoup parsers for Screenslate and Time Out agree (offline)
+
+Each scraper has two copies of its tile parsing rules: CSS selectors for the selectolax
+tree (used by default) and the BeautifulSoup version used with FEATUREFINDER_SELECTOLAX=0.
+These tests parse the same fixed listings both ways and compare every tile.
+"""
+import pytest
+from scrapers.base import BaseScraper, FAST_PARSE
+from scrapers.screenslate import ScreenslateScraper, _FALLBACK_TILE_SELECTOR, _TILE_STRAINER
+from scrapers.timeout_nyc import TimeOutScraper, _TILE_SELECTOR, _TILE_RE, _LISTING_SELECTOR, _LISTING_RE, _EVENT_STRAINER
+
+SCREENSLATE_TILES = '''
+<html><body><main>
+<article class="tile">
+  <h3>Stalker</h3>
+  <span class="venue-name">Film Forum</span>
+  <time datetime="2025-10-12T19:30">Oct 12, 7:30 PM</time>
+  <p class="film-description">New 35mm print, Q&amp;A with director in person.</p>
+  <a href="/screenings/123">Details</a>
+</article>
+<article class="tile featured">
+  <a class="film-title" href="/films/456">Paris, Texas</a>
+  <a href="/venues/ifc-center">IFC Center</a>
+  <div class="date-time">Sunday 9:00 PM</div>
+  <div class="Synopsis">Restored in 4K for the 40th anniversary.</div>
+</article>
+<article class="tile">
+  <h4>Weekend Blockbuster</h4>
+  <span class="venue">AMC Empire 25</span>
+  <p>Regular showtimes all week.</p>
+</article>
+<article class="tile"><div class="poster"></div></article>
+<article class="tile">
+  <h2>Dune: Part Two</h2>
+  <div class="location">Metrograph</div>
+  <script>var format = "IMAX 70mm";</script>
+  <span class="when">Tickets on sale October 1</span>
+  <div class="about">Sneak preview screening</div>
+</article>
+</main></body></html>
+'''
+
+SCREENSLATE_FALLBACK = '''
+<html><body>
+<div class="screening-card">
+  <h3>Chungking Express</h3>
+  <span class="theater">Angelika Film Center</span>
+  <span class="showtime">Friday 10:00 PM</span>
+</div>
+<article class="event-listing">
+  <h3>Local Hero</h3>
+  <p class="cinema">Anthology Film Archives</p>
+  <p class="summary">Director in person for a Q and A</p>
+  <a href="https://example.com/tickets">Tickets</a>
+</article>
+</body></html>
+'''
+
+TIMEOUT_TILES = '''
+<html><body>
+<article class="tile _article_wkzyo_1">
+  <h3 class="_h3_c6c0h_1">Review: Frankenstein</h3>
+  <span class="venue">Paris Theater</span>
+  <p class="_description_x">Premiere with director appearance</p>
+  <time class="date">Oct 17</time>
+  <a href="/newyork/film/frankenstein">Read more</a>
+</article>
+<article class="tile">
+  <h2 class="card-title">NYFF Closing Night</h2>
+  <div class="location-name">Alice Tully Hall</div>
+  <div class="summary">Festival screening in 70mm</div>
+</article>
+<article class="Article tile">
+  <a class="event-name" href="https://www.timeout.com/newyork/film/x">Midnight Movies</a>
+  <p class="excerpt">A special advance screening</p>
+  <span class="when">Saturday</span>
+</article>
+<article class="tile"><h3>Hi</h3></article>
+</body></html>
+'''
+
+TIMEOUT_FALLBACK = '''
+<html><body>
+<div class="event-card">
+  <h3 class="title">Film Forum Jr.</h3>
+  <span class="theater">Film Forum</span>
+</div>
+<li class="listing">
+  <h4>IMAX Marathon</h4>
+  <p class="venue">AMC Lincoln Square</p>
+  <div class="time">All night</div>
+</li>
+</body></html>
+'''
+
+
+def _fast_and_slow(html, strainer):
+    """Parse a listing the selectolax way (default) and the BeautifulSoup way (fallback)"""
+    if not FAST_PARSE:
+        pytest.skip("selectolax not installed or disabled")
+    return BaseScraper._parse_html(html, fast=True), BaseScraper._parse_html(html, strainer, fast=False)
+
+
+def _as_dict(screening):
+    return screening.to_dict() if screening else None
+
+
+def _assert_same_tiles(nodes, elements, parse_node, parse_element):
+    """Both parsers found the same tiles and extract the same screening from each"""
+    assert len(nodes) == len(elements), f"{len(nodes)} selectolax tiles vs {len(elements)} BeautifulSoup tiles"
+    for node, element in zip(nodes, elements):
+        assert _as_dict(parse_node(node)) == _as_dict(parse_element(element))
+
+
+def test_screenslate_parsers_agree():
+    """Screenslate: _parse_screening_node and _parse_screening give the same screenings"""
+    scraper = ScreenslateScraper()
+    tree, soup = _fast_and_slow(SCREENSLATE_TILES, _TILE_STRAINER)
+    _assert_same_tiles(tree.css('article.tile'), soup.select('article.tile'),
+                       scraper._parse_screening_node, scraper._parse_screening)
+
+    # The tiles above cover both a relevant and a skipped screening
+    parsed = [scraper._parse_screening(element) for element in soup.select('article.tile')]
+    assert any(parsed) and None in parsed
+
+    tree, soup = _fast_and_slow(SCREENSLATE_FALLBACK, _TILE_STRAINER)
+    _assert_same_tiles(tree.css(_FALLBACK_TILE_SELECTOR), soup.select(_FALLBACK_TILE_SELECTOR),
+                       scraper._parse_screening_node, scraper._parse_screening)
+    print("✓ Screenslate selectolax and BeautifulSoup parsers agree")
+
+
+def test_timeout_parsers_agree():
+    """Time Out: _parse_event_node and _parse_event give the same screenings"""
+    scraper = TimeOutScraper()
+    tree, soup = _fast_and_slow(TIMEOUT_TILES, _EVENT_STRAINER)
+    _assert_same_tiles(tree.css(_TILE_SELECTOR), soup.find_all('article', class_=_TILE_RE),
+                       scraper._parse_event_node, scraper._parse_event)
+
+    tree, soup = _fast_and_slow(TIMEOUT_FALLBACK, _EVENT_STRAINER)
+    _assert_same_tiles(tree.css(_LISTING_SELECTOR), soup.find_all(['div', 'li'], class_=_LISTING_RE),
+                       scraper._parse_event_node, scraper._parse_event)
+    print("✓ Time Out selectolax and BeautifulSoup parsers agree")
+
+
+if __name__ == '__main__':
+    test_screenslate_parsers_agree()
+    test_timeout_parsers_agree()
@@ -1,29 +1,38 @@
 """
 Test script for MoMA scraper
 """
+import sys
+from itertools import islice
 from scrapers.moma import MoMAScraper
+from scrapers.browser_pool import shared_browser
 
-def test_moma_scraper():
+def test_moma_scraper(playwright_browser):
     print("Testing MoMA scraper...")
     scraper = MoMAScraper()
-    screenings = scraper.scrape()
+    # Only the first 5 are printed; the rest are just counted, not kept
+    screenings_iter = scraper.iter_screenings()
+    screenings = list(islice(screenings_iter, 5))
+    total = len(screenings) + sum(1 for _ in screenings_iter)
 
-    print(f"\nFound {len(screenings)} screenings from MoMA")
+    # Collect the report and write it in one go
+    report = [f"\nFound {total} screenings from MoMA"]
 
     if screenings:
-        print("\nFirst few screenings:")
-        for i, screening in enumerate(screenings[:5], 1):
-            print(f"\n{i}. {screening.title}")
-            print(f"   Date: {screening.date}")
-            print(f"   Special Note: {screening.special_note}")
-            print(f"   Director: {screening.director}")
-            print(f"   Description: {screening.description[:100]}..." if len(screening.description) > 100 else f"   Description: {screening.description}")
-            print(f"   URL: {screening.url}")
+        report.append("\nFirst few screenings:")
+        for i, screening in enumerate(screenings, 1):
+            report.append(f"\n{i}. {screening.title}")
+            report.append(f"   Date: {screening.date}")
+            report.append(f"   Special Note: {screening.special_note}")
+            report.append(f"   Director: {screening.director}")
+            report.append(f"   Description: {screening.description[:100]}..." if len(screening.description) > 100 else f"   Description: {screening.description}")
+            report.append(f"   URL: {screening.url}")
     else:
-        print("No screenings found. This might be expected if:")
-        print("  1. Playwright is not installed")
-        print("  2. MoMA's website structure has changed")
-        print("  3. There are currently no film events listed")
+        report.append("No screenings found. This might be expected if:")
+        report.append("  1. Playwright is not installed")
+        report.append("  2. MoMA's website structure has changed")
+        report.append("  3. There are currently no film events listed")
+
+    sys.stdout.write("\n".join(report) + "\n")
 
 if __name__ == '__main__':
-    test_moma_scraper()
+    test_moma_scraper(shared_browser)
@@ -2,35 +2,46 @@
 """
 Test script for Paris Theater scraper
 """
+import sys
+from itertools import islice
 from scrapers.paris_theater import ParisTheaterScraper
+from scrapers.browser_pool import shared_browser
 
-def main():
-    print("=" * 70)
+BANNER = "=" * 70
+
+def test_paris_theater(playwright_browser):
+    print(BANNER)
     print("TESTING PARIS THEATER SCRAPER")
-    print("=" * 70)
+    print(BANNER)
 
     scraper = ParisTheaterScraper()
-    screenings = scraper.scrape()
+    # Only the first 5 are printed; the rest are just counted, not kept
+    screenings_iter = scraper.iter_screenings()
+    screenings = list(islice(screenings_iter, 5))
+    total = len(screenings) + sum(1 for _ in screenings_iter)
 
-    print("\n" + "=" * 70)
-    print(f"RESULTS: Found {len(screenings)} screenings")
-    print("=" * 70)
+    # Collect the report and write it in one go
+    report = ["\n" + BANNER]
+    report.append(f"RESULTS: Found {total} screenings")
+    report.append(BANNER)
 
     if screenings:
-        print("\nFirst 5 screenings:")
-        for i, screening in enumerate(screenings[:5], 1):
-            print(f"\n{i}. {screening.title}")
-            print(f"   Date: {screening.date}")
-            print(f"   Description: {screening.description[:100]}..." if screening.description else "   Description: N/A")
-            print(f"   Special: {screening.special_note}")
-            print(f"   URL: {screening.url}")
+        report.append("\nFirst 5 screenings:")
+        for i, screening in enumerate(screenings, 1):
+            report.append(f"\n{i}. {screening.title}")
+            report.append(f"   Date: {screening.date}")
+            report.append(f"   Description: {screening.description[:100]}..." if screening.description else "   Description: N/A")
+            report.append(f"   Special: {screening.special_note}")
+            report.append(f"   URL: {screening.url}")
     else:
-        print("\n⚠️  No screenings found")
-        print("\nPossible issues:")
-        print("- Website structure has changed")
-        print("- JavaScript rendering not working")
-        print("- Playwright not installed")
-        print("- Network issues or website returning 503 errors")
+        report.append("\n⚠️  No screenings found")
+        report.append("\nPossible issues:")
+        report.append("- Website structure has changed")
+        report.append("- JavaScript rendering not working")
+        report.append("- Playwright not installed")
+        report.append("- Network issues or website returning 503 errors")
+
+    sys.stdout.write("\n".join(report) + "\n")
 
 if __name__ == "__main__":
-    main()
+    test_paris_theater(shared_browser)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Tests for date extraction in the Reddit scraper (offline)
+
+_extract_date scans the text once with a combined pattern but must keep the old
+preference order: an MM/DD date first, then a weekday, then a month name and day.
+"""
+from scrapers.reddit import RedditScraper
+
+BANNER = "=" * 60
+
+DATE_CASES = [
+    # MM/DD wins, and a month name right before it doesn't swallow its first digits
+    ('see you jan 12/15', '12/15'),
+    ('Friday 10/3 at Film Forum', '10/3'),
+    # A weekday beats an earlier month name
+    ('Oct 10 and monday', 'monday'),
+    ('Screening on SATURDAY', 'SATURDAY'),
+    # Month name and day; the first one in the text is used
+    ('December 5', 'December 5'),
+    ('Sept 30 or Oct 2', 'Sept 30'),
+    ('no date', ''),
+    ('', ''),
+]
+
+
+def test_extract_date():
+    """Each format is found, in the order MM/DD, weekday, month name"""
+    scraper = RedditScraper()
+
+    for text, expected in DATE_CASES:
+        result = scraper._extract_date(text)
+        assert result == expected, f"{text!r} -> {result!r}, expected {expected!r}"
+        print(f"✓ {text!r} -> {result!r}")
+
+
+if __name__ == '__main__':
+    print(BANNER)
+    print("REDDIT DATE EXTRACTION TESTS")
+    print(BANNER)
+    test_extract_date()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the scrape manifest and the screenings reuse in BaseScraper (offline)
+"""
+import os
+import tempfile
+import time
+import scraped_manifest
+from scrapers.base import BaseScraper, Screening
+
+BANNER = "=" * 60
+
+RECORD = Screening(
+    title='Anora', theater='Film at Lincoln Center', date='October 12', time_slot='7:30 PM',
+    description='Q&A with director', special_note='Q&A', director='Sean Baker',
+    ticket_info='On sale', url='https://www.filmlinc.org/films/anora/', priority=1,
+    ticket_sale_date='October 1', tickets_on_sale='on_sale'
+).to_dict()
+
+
+class _ListingScraper(BaseScraper):
+    """Scraper whose listing 'parse' yields fixed screenings and counts its calls"""
+
+    def __init__(self, screenings):
+        super().__init__('Test Listing')
+        self.screenings = screenings
+        self.parse_calls = 0
+
+    def scrape(self):
+        return list(self.iter_screenings())
+
+    def iter_screenings(self):
+        self._parse_fetched('<html><body><article>Anora</article></body></html>')
+        yield from self.screenings_from_listing('https://example.com/listing', self._parse_listing)
+
+    def _parse_listing(self):
+        self.parse_calls += 1
+        yield from self.screenings
+
+
+def _use_temp_manifest():
+    """Point the manifest at a fresh temporary database; returns the previous path"""
+    previous = scraped_manifest.SCRAPED_MANIFEST_PATH
+    scraped_manifest.SCRAPED_MANIFEST_PATH = os.path.join(tempfile.mkdtemp(), 'manifest.sqlite3')
+    return previous
+
+
+def test_lookup_mark_reset():
+    """Recorded screenings come back only for the same URL and key"""
+    previous = _use_temp_manifest()
+    try:
+        url = 'https://example.com/listing'
+        assert scraped_manifest.lookup(url, 'key-1') is None
+
+        scraped_manifest.mark(url, 'key-1', [RECORD])
+        assert scraped_manifest.lookup(url, 'key-1') == [RECORD]
+        assert scraped_manifest.lookup(url, 'key-2') is None
+        assert scraped_manifest.lookup('https://example.com/other', 'key-1') is None
+
+        scraped_manifest.reset_manifest()
+        assert scraped_manifest.lookup(url, 'key-1') is None
+    finally:
+        scraped_manifest.SCRAPED_MANIFEST_PATH = previous
+    print("✓ Test 1 passed: lookup/mark/reset_manifest")
+
+
+def test_lookup_ignores_old_entries():
+    """Entries older than MANIFEST_MAX_AGE_SECONDS are not reused"""
+    previous = _use_temp_manifest()
+    real_time = time.time
+    try:
+        url = 'https://example.com/listing'
+        scraped_manifest.mark(url, 'key-1', [RECORD])
+        scraped_manifest.time.time = lambda: real_time() + scraped_manifest.MANIFEST_MAX_AGE_SECONDS + 1
+        assert scraped_manifest.lookup(url, 'key-1') is None
+    finally:
+        scraped_manifest.time.time = real_time
+        scraped_manifest.SCRAPED_MANIFEST_PATH = previous
+    print("✓ Test 2 passed: Old entries expire")
+
+
+def test_screening_round_trip():
+    """Screening.from_dict rebuilds exactly what to_dict stored"""
+    assert Screening.from_dict(RECORD).to_dict() == RECORD
+    print("✓ Test 3 passed: Screening.from_dict(to_dict()) round-trips")
+
+
+def test_screenings_from_listing():
+    """Unchanged listings reuse recorded screenings; empty or partial results aren't recorded"""
+    previous = _use_temp_manifest()
+    try:
+        screening = Screening.from_dict(RECORD)
+
+        scraper = _ListingScraper([screening])
+        assert [s.to_dict() for s in scraper.scrape()] == [RECORD]
+        assert scraper.parse_calls == 1
+
+        # Same page and parser: reused without parsing
+        scraper = _ListingScraper([screening])
+        assert [s.to_dict() for s in scraper.scrape()] == [RECORD]
+        assert scraper.parse_calls == 0
+
+        # A different parser version must parse again
+        scraped_manifest.source_version.cache_clear()
+        real_source_version = scraped_manifest.source_version
+        scraped_manifest.source_version = lambda files: 'edited parser'
+        try:
+            scraper = _ListingScraper([screening])
+            scraper.scrape()
+            assert scraper.parse_calls == 1
+        finally:
+            scraped_manifest.source_version = real_source_version
+
+        # Empty results are not recorded
+        scraped_manifest.reset_manifest()
+        _ListingScraper([]).scrape()
+        scraper = _ListingScraper([screening])
+        scraper.scrape()
+        assert scraper.parse_calls == 1
+
+        # A listing that was only partly consumed is not recorded
+        scraped_manifest.reset_manifest()
+        next(_ListingScraper([screening, screening]).iter_screenings())
+        scraper = _ListingScraper([screening])
+        scraper.scrape()
+        assert scraper.parse_calls == 1
+    finally:
+        scraped_manifest.SCRAPED_MANIFEST_PATH = previous
+    print("✓ Test 4 passed: Listings are reused only when unchanged and fully parsed")
+
+
+def main():
+    """Run all tests"""
+    print(BANNER)
+    print("SCRAPE MANIFEST TESTS")
+    print(BANNER)
+    print()
+
+    try:
+        test_lookup_mark_reset()
+        test_lookup_ignores_old_entries()
+        test_screening_round_trip()
+        test_screenings_from_listing()
+
+        print()
+        print(BANNER)
+        print("✓ ALL TESTS PASSED!")
+        print(BANNER)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the Lincoln Center, MoMA and Paris Theater scrapers, run concurrently
+
+Each scraper spends most of its time waiting on its site, so they run in parallel
+threads and render in the one shared browser (a separate context per page). The
+whole test takes about as long as the slowest site instead of all three added up.
+Under pytest this replaces test_lincoln_center.py, test_moma.py and test_paris_theater.py
+(see collect_ignore in conftest.py); those still run on their own as scripts.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from config import FETCH_WORKERS
+from scrapers.film_at_lincoln_center import FilmAtLincolnCenterScraper
+from scrapers.moma import MoMAScraper
+from scrapers.paris_theater import ParisTheaterScraper
+from scrapers.browser_pool import shared_browser
+
+BANNER = "=" * 70
+
+SMOKE_SCRAPERS = [FilmAtLincolnCenterScraper, MoMAScraper, ParisTheaterScraper]
+
+
+def scrape_concurrently(scraper_classes):
+    """Run each scraper in its own thread; returns {scraper name: screenings}"""
+    scrapers = [scraper_class() for scraper_class in scraper_classes]
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(scrapers))) as executor:
+        results = executor.map(lambda scraper: scraper.scrape(), scrapers)
+        return {scraper.name: screenings for scraper, screenings in zip(scrapers, results)}
+
+
+def test_scrapers_smoke(playwright_browser):
+    """All three scrapers run to completion and every screening has a title and a ticket link"""
+    print(BANNER)
+    print("SCRAPER SMOKE TEST (Lincoln Center, MoMA, Paris Theater)")
+    print(BANNER)
+
+    results = scrape_concurrently(SMOKE_SCRAPERS)
+
+    print("\n" + BANNER)
+    for name, screenings in results.items():
+        print(f"{name}: {len(screenings)} screenings")
+        for screening in screenings[:3]:
+            print(f"   - {screening.title} ({screening.date})")
+        for screening in screenings:
+            assert screening.title, f"{name} returned a screening without a title"
+            assert screening.theater == name, f"{name} returned a screening at {screening.theater}"
+            assert screening.url.startswith('http'), f"{name}: '{screening.title}' has no ticket URL"
+    print(BANNER)
+
+
+if __name__ == "__main__":
+    test_scrapers_smoke(shared_browser)
@@ -4,6 +4,8 @@ Test script to verify that all screenings have ticket URLs
 """
 from config import get_theater_url
 
+BANNER = "=" * 60
+
 
 def test_screening_url_fallback():
     """Test that screenings without URLs get fallback URLs"""
@@ -35,53 +37,55 @@ def test_get_theater_url():
     print("✓ Test 3 passed: Unknown theater returns empty string")
 
 
+def test_theater_name_variants():
+    """Test that differently written theater names still find the theater's URL"""
+    assert get_theater_url('film at lincoln center') == 'https://www.filmlinc.org/'
+    assert get_theater_url('  Film at Lincoln Center ') == 'https://www.filmlinc.org/'
+    assert get_theater_url('Lincoln Center - Walter Reade') == 'https://www.filmlinc.org/'
+    assert get_theater_url('Angelika Film Center & Café') == 'https://www.angelikafilmcenter.com/nyc'
+    assert get_theater_url('AMC') == ''
+    # A known name followed by other words is a different venue
+    assert get_theater_url('MoMA PS1') == ''
+    assert get_theater_url('Alamo Drafthouse Brooklyn') == ''
+    assert get_theater_url('Alamo Drafthouse') == ''
+    print("✓ Test 3b passed: Name variants and aliases resolve to the theater's URL")
+
+
 def test_scraper_import_syntax():
     """Test that scraper files have valid syntax"""
-    import py_compile
-    import os
-
-    scrapers = [
-        'scrapers/film_at_lincoln_center.py',
-        'scrapers/metrograph.py',
-        'scrapers/film_forum.py',
-        'scrapers/angelika.py',
-        'scrapers/ifc_center.py',
-        'scrapers/new_yorker.py',
-        'scrapers/timeout_nyc.py',
-        'scrapers/screenslate.py'
-    ]
-
-    for scraper in scrapers:
-        if os.path.exists(scraper):
-            try:
-                py_compile.compile(scraper, doraise=True)
-            except py_compile.PyCompileError as e:
-                print(f"✗ Test 4 failed: Syntax error in {scraper} - {e}")
-                raise
+    import compileall
+
+    # Checks every scraper module. Files whose cached bytecode is still current
+    # compiled cleanly last time and are skipped, so only edited files are recompiled.
+    if not compileall.compile_dir('scrapers', maxlevels=0, quiet=1):
+        print("✗ Test 4 failed: Syntax error in a scraper (see compile output above)")
+        raise AssertionError("Syntax error in a scraper")
 
     print("✓ Test 4 passed: All scrapers have valid syntax")
 
 
 def main():
     """Run all tests"""
-    print("=" * 60)
+    print(BANNER)
     print("TICKET URL FALLBACK TESTS")
-    print("=" * 60)
+    print(BANNER)
     print()
 
     try:
         test_get_theater_url()
         test_screening_url_fallback()
+        test_theater_name_variants()
         test_scraper_import_syntax()
 
         print()
-        print("=" * 60)
+        print(BANNER)
         print("✓ ALL TESTS PASSED!")
-        print("=" * 60)
+        print(BANNER)
         print()
         print("Summary:")
         print("• Helper function works correctly")
         print("• Fallback URL mechanism works")
+        print("• Theater name variants resolve to the right URL")
         print("• All scrapers have valid Python syntax")
         print("• Every screening will now have a ticket link")
         return 0